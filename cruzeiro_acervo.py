@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+"""Acervo de várias planilhas (por década, por fonte...) analisadas juntas, com poda de partições.
+
+O acervo é uma pasta com planilhas .xlsx ou um manifesto JSON (ARQUIVO_MANIFESTO dentro da
+pasta, ou o caminho do próprio arquivo), com caminhos relativos à pasta do manifesto:
+
+    {"planilhas": [
+        {"arquivo": "Cruzeiro 1921-1989.xlsx", "fonte": "Arquivo do clube", "anos": [1921, 1989]},
+        {"arquivo": "Cruzeiro 1990-2025.xlsx", "fonte": "Planilha original"}
+    ]}
+
+Cada planilha é uma partição, com a sua fonte, as suas abas (competições) e a sua faixa de anos.
+Os anos vêm do manifesto ou do snapshot da planilha (gravado na primeira carga, ver
+cruzeiro_dados.salvar_snapshot); sem nenhum dos dois, a partição entra em todas as consultas.
+Cada consulta carrega só as partições que podem ter a competição e o ano pedidos
+(particoes_da_consulta) e as combina, uma de cada vez, numa base comum (carregar_particoes) para
+as análises de cruzeiro_analises.
+"""
+
+import json
+import os
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+
+from cruzeiro_analises import TIPO_EVENTO
+from cruzeiro_dados import (
+    COLUNAS_ESSENCIAIS, abas_planilha, assinatura_apelidos, assinatura_arquivo, carregar_base, congelar_base,
+    explodir_eventos, ler_manifesto_snapshot, montar_base
+)
+from cruzeiro_diagnostico import contar, cronometrado
+
+ARQUIVO_MANIFESTO = "acervo.json"
+MAXIMO_COMBINACOES = 4 # Bases combinadas guardadas (as das consultas mais recentes)
+
+# Bases combinadas: versões das partições -> base (LRU)
+_COMBINADAS = OrderedDict()
+_TRAVA_COMBINADAS = threading.Lock() # Protege _COMBINADAS e _TRAVAS_CARGA (nunca fica com ela durante uma carga)
+_TRAVAS_CARGA = {} # Versões das partições -> trava da carga em andamento dessa combinação
+
+# --- Partições ---
+
+def _planilhas_do_acervo(caminho):
+    """Entradas do manifesto do acervo (ou todas as .xlsx da pasta, sem manifesto), com caminhos absolutos."""
+    manifesto = os.path.join(caminho, ARQUIVO_MANIFESTO) if os.path.isdir(caminho) else caminho
+    if os.path.isdir(caminho) and not os.path.exists(manifesto):
+        return [
+            {"arquivo": os.path.join(os.path.abspath(caminho), nome)}
+            for nome in sorted(os.listdir(caminho)) if nome.lower().endswith(".xlsx") and not nome.startswith("~$")
+        ]
+    with open(manifesto, encoding="utf-8") as f:
+        planilhas = json.load(f).get("planilhas", [])
+    pasta = os.path.dirname(os.path.abspath(manifesto))
+    return [dict(planilha, arquivo=os.path.join(pasta, planilha["arquivo"])) for planilha in planilhas]
+
+def listar_particoes(caminho):
+    """Partições do acervo, da mais antiga para a mais recente (sem faixa de anos conhecida, no fim).
+
+    Cada partição tem 'arquivo', 'fonte' (do manifesto ou o nome do arquivo), 'abas' e 'anos'
+    ((primeiro, último) ou None), obtidos sem carregar as planilhas.
+    """
+    particoes = []
+    for planilha in _planilhas_do_acervo(caminho):
+        arquivo = planilha["arquivo"]
+        snapshot = ler_manifesto_snapshot(arquivo, *assinatura_arquivo(arquivo)) or {}
+        anos = planilha.get("anos") or snapshot.get("anos")
+        particoes.append({
+            "arquivo": arquivo,
+            "fonte": planilha.get("fonte") or os.path.splitext(os.path.basename(arquivo))[0],
+            "abas": tuple(snapshot.get("abas") or abas_planilha(arquivo)),
+            "anos": tuple(anos) if anos else None,
+        })
+    return sorted(particoes, key=lambda particao: (particao["anos"] is None, particao["anos"] or ()))
+
+def abas_do_acervo(particoes):
+    """Abas (competições) de todas as partições, na ordem de primeira aparição."""
+    return list(dict.fromkeys(aba for particao in particoes for aba in particao["abas"]))
+
+def particoes_da_consulta(particoes, analise=None, competicao="Todas", ano=None):
+    """Poda: só as partições que podem ter dados da competição e do ano pedidos.
+
+    Com a chave da análise (ver cruzeiro_analises.executar_analise), os filtros que ela não usa
+    não podam: o ano só vale para os rankings por ano, os lances e as listas de gols/assistências,
+    e as listas usam todas as competições.
+    """
+    if analise in TIPO_EVENTO:
+        competicao = "Todas"
+    elif analise is not None and analise not in ["analise_por_ano", "lances_especiais"]:
+        ano = None
+    return [
+        particao for particao in particoes
+        if (not competicao or competicao == "Todas" or competicao in particao["abas"])
+        and (not ano or particao["anos"] is None or particao["anos"][0] <= ano <= particao["anos"][1])
+    ]
+
+# --- Combinação ---
+
+def combinar_bases(bases, abas_acervo=None):
+    """Uma base com as partidas e os eventos de várias, consumidas uma de cada vez (bases pode ser um gerador).
+
+    Abas de mesmo nome em partições diferentes viram uma aba só; as linhas de cada partição são
+    deslocadas para não colidirem (os lances de uma partida são identificados por aba e linha).
+    Uma coluna só falta na aba combinada se faltar em todas as partições; nas outras, fica vazia.
+    Com abas_acervo (ver abas_do_acervo), as abas seguem essa ordem e as que nenhuma das bases
+    tem (partições podadas) entram vazias, como numa planilha sem partidas no filtro.
+    """
+    abas, partes, faltando, eventos, apelidos = [], {}, {}, [], {}
+    proxima_linha = {} # aba -> primeira linha livre na aba combinada
+    for base in bases:
+        apelidos.update(base["apelidos"])
+        inicio = {}
+        for aba in base["abas"]:
+            df = base["partidas"][aba]
+            inicio[aba] = proxima_linha.get(aba, 0)
+            if aba not in partes:
+                abas.append(aba)
+                partes[aba], faltando[aba] = [], set(base["faltando"][aba])
+            else:
+                faltando[aba] &= set(base["faltando"][aba])
+            partes[aba].append(df.set_axis(df.index + inicio[aba]))
+            proxima_linha[aba] = inicio[aba] + (int(df.index.max()) + 1 if len(df) else 0)
+        eventos.append(base["eventos"].assign(linha=base["eventos"]["linha"] + base["eventos"]["aba"].astype(object).map(inicio).astype("int64")))
+
+    for aba in abas_acervo or []:
+        if aba not in partes:
+            partes[aba], faltando[aba] = [pd.DataFrame(columns=COLUNAS_ESSENCIAIS)], set()
+    if abas_acervo:
+        abas = list(abas_acervo) + [aba for aba in abas if aba not in abas_acervo]
+
+    partidas = {}
+    for aba in abas:
+        faltando[aba] = [c for c in COLUNAS_ESSENCIAIS if c in faltando[aba]]
+        partidas[aba] = pd.concat(partes[aba]).reindex(columns=[c for c in COLUNAS_ESSENCIAIS if c not in faltando[aba]])
+    eventos = pd.concat(eventos, ignore_index=True) if eventos else explodir_eventos(pd.DataFrame(), "")
+    return congelar_base(montar_base(abas, partidas, faltando, eventos, apelidos=apelidos))
+
+@cronometrado("acervo: carga")
+def carregar_particoes(particoes, workers=None, abas_acervo=None):
+    """Base das partições informadas (ver particoes_da_consulta), combinada e guardada para as próximas consultas.
+
+    Com abas_acervo (ver abas_do_acervo), a base tem todas as competições do acervo, mesmo as
+    que só existem nas partições podadas (vazias), e uma consulta sem partições dá um resultado
+    vazio, como na planilha inteira.
+
+    Cada planilha é carregada (do snapshot, se estiver atualizado) só enquanto é combinada: a
+    memória fica com as bases combinadas das MAXIMO_COMBINACOES consultas mais recentes, e não
+    com o acervo inteiro. Com uma partição só, a base dela é usada sem cópia.
+
+    Consultas simultâneas da mesma combinação esperam uma única carga; as de combinações já
+    guardadas não esperam a carga de outras.
+    """
+    chave = tuple((p["arquivo"],) + assinatura_arquivo(p["arquivo"]) + (assinatura_apelidos(p["arquivo"]),) for p in particoes)
+    chave += (tuple(abas_acervo or ()),)
+    base = _combinacao_guardada(chave)
+    if base is not None:
+        return base
+    with _TRAVA_COMBINADAS:
+        trava = _TRAVAS_CARGA.setdefault(chave, threading.Lock())
+
+    with trava:
+        base = _combinacao_guardada(chave) # Outra thread pode ter combinado estas partições enquanto esperava
+        if base is not None:
+            return base
+        try:
+            contar("acervo: partições carregadas", len(particoes))
+            bases = (carregar_base(p["arquivo"], workers=workers, manter_em_memoria=False) for p in particoes)
+            if len(particoes) == 1 and set(abas_acervo or ()) <= set(particoes[0]["abas"]):
+                base = next(bases)
+            else:
+                base = combinar_bases(bases, abas_acervo)
+            with _TRAVA_COMBINADAS:
+                _COMBINADAS[chave] = base
+                while len(_COMBINADAS) > MAXIMO_COMBINACOES:
+                    _COMBINADAS.popitem(last=False)
+            return base
+        finally:
+            with _TRAVA_COMBINADAS:
+                _TRAVAS_CARGA.pop(chave, None)
+
+def _combinacao_guardada(chave):
+    """Base combinada guardada para a chave (marcada como a mais recente), ou None."""
+    with _TRAVA_COMBINADAS:
+        if chave not in _COMBINADAS:
+            return None
+        _COMBINADAS.move_to_end(chave)
+        contar("acervo: combinação em memória")
+        return _COMBINADAS[chave]
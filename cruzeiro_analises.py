@@ -0,0 +1,225 @@
+# -*- coding: utf-8 -*-
+"""Motor de consultas das análises do app, sem dependência do Streamlit.
+
+Cada análise recebe a base carregada (ver cruzeiro_dados.carregar_base) e os filtros, e devolve
+um DataFrame. Abas sem as colunas necessárias são puladas; as mensagens sobre elas vêm de
+avisos_analise, para a interface exibir como quiser.
+"""
+
+import pandas as pd
+
+from cruzeiro_dados import CLASSES_TERMOS, calcular_ranking, eventos_do_jogador, id_jogador
+from cruzeiro_diagnostico import cronometrado
+
+# Colunas que cada análise exige em uma aba para considerá-la
+COLUNAS_POR_ANALISE = {
+    "numeros_gerais": ["gols", "assistências", "campeonato", "ano"],
+    "jogos_participacoes": ["gols", "assistências", "partida", "campeonato", "ano"],
+    "gols": ["gols", "partida", "campeonato", "ano"],
+    "assistencias": ["assistências", "partida", "campeonato", "ano"],
+}
+
+TIPO_EVENTO = {"gols": "gols", "assistencias": "assistências"} # Chave da análise -> valor de 'tipo' nos eventos
+
+# Classe do lance (ver cruzeiro_dados.CLASSES_TERMOS) -> coluna em lances_especiais
+ROTULOS_CLASSES = {"penalti": "Pênaltis", "gol_contra": "Gols Contra", "falta": "Gols de Falta", "sem_ass": "Sem Assistência"}
+
+# --- Filtros ---
+
+def abas_da_competicao(base, competicao="Todas"):
+    """Abas a analisar: todas para 'Todas' (ou vazio/None), a própria aba, ou [] se ela não existir."""
+    if not competicao or competicao == "Todas":
+        return list(base["abas"])
+    return [competicao] if competicao in base["abas"] else []
+
+def abas_validas(base, abas, analise):
+    """Filtra as abas que têm todas as colunas exigidas pela análise (ver COLUNAS_POR_ANALISE)."""
+    colunas = COLUNAS_POR_ANALISE.get(analise, [])
+    return [aba for aba in abas if not any(c in base["faltando"][aba] for c in colunas)]
+
+def avisos_analise(base, analise, competicao="Todas", ano=None):
+    """Mensagens sobre as abas puladas pela análise por falta de colunas."""
+    # Listas de gols/assistências sempre consideram todas as abas
+    abas = base["abas"] if analise in TIPO_EVENTO else abas_da_competicao(base, competicao)
+    avisos = []
+    for aba in abas:
+        faltando = base["faltando"][aba]
+        if analise in COLUNAS_POR_ANALISE:
+            colunas_faltando = [c for c in COLUNAS_POR_ANALISE[analise] if c in faltando]
+            if colunas_faltando:
+                sufixo = f" para lista de {'Gols' if analise == 'gols' else 'Assistências'}" if analise in TIPO_EVENTO else ""
+                avisos.append(f"⚠️ Aba '{aba}': Faltando colunas: {', '.join(colunas_faltando)}. Pulando{sufixo}.")
+        elif analise == "analise_por_ano" and ano and "ano" in faltando:
+            avisos.append(f"⚠️ Aba '{aba}': Faltando coluna 'ano'. Pulando para ranking anual.")
+        elif "gols" in faltando and "assistências" in faltando:
+            sufixo = " para ranking" if analise == "ranking" else ""
+            avisos.append(f"⚠️ Aba '{aba}': Faltando 'gols' e 'assistências'. Pulando{sufixo}.")
+    return avisos
+
+# --- Análises ---
+
+@cronometrado("análise: numeros_gerais")
+def numeros_gerais(base, jogador, competicao="Todas"):
+    """Números do jogador por competição e ano, com o Total de cada aba e o Total Geral.
+
+    Usa só as linhas do jogador no cubo (via índice); anos ou campeonatos ausentes não entram.
+    Colunas: Competição, Ano, Gols, Assistências ('Ano' é 'Total' nas linhas de total da aba e
+    a última linha é o 'Total Geral'). DataFrame vazio se não houver participações.
+    """
+    abas = abas_validas(base, abas_da_competicao(base, competicao), "numeros_gerais")
+    posicoes = base["indice_cubo"].get(id_jogador(jogador, base["apelidos"]), [])
+    fatia = base["cubo"].iloc[posicoes]
+    fatia = fatia[fatia["ano"].notna() & fatia["campeonato"].notna() & fatia["aba"].isin(abas)]
+
+    # Um único agrupamento para todas as abas; com as categorias de 'aba' na ordem de abas, o
+    # resultado já sai ordenado por aba (nessa ordem), campeonato e ano
+    fatia = fatia.assign(aba=fatia["aba"].cat.set_categories(abas), ano=fatia["ano"].astype(int))
+    resumo = fatia.groupby(["aba", "campeonato", "ano"], observed=True)[["gols", "assistências"]].sum().reset_index()
+    return tabela_numeros_gerais(resumo)
+
+def tabela_numeros_gerais(resumo):
+    """Linhas de numeros_gerais a partir do resumo com as colunas aba, campeonato, ano, gols e assistências.
+
+    O resumo vem ordenado por aba (na ordem das abas), campeonato e ano; cada aba com
+    participações ganha uma linha de Total, com o nome do último campeonato listado (como na
+    versão linha a linha).
+    """
+    linhas = []
+    total_gols = total_assists = 0 # Da aba atual
+    total_geral_gols = 0
+    total_geral_assists = 0
+    abas = resumo["aba"].tolist()
+    colunas = zip(abas, resumo["campeonato"].tolist(), resumo["ano"].tolist(), resumo["gols"].tolist(), resumo["assistências"].tolist())
+    for i, (aba, campeonato, ano, gols, assists) in enumerate(colunas):
+        linhas.append({"Competição": campeonato, "Ano": int(ano), "Gols": int(gols), "Assistências": int(assists)})
+        total_gols += int(gols)
+        total_assists += int(assists)
+        if i + 1 == len(abas) or abas[i + 1] != aba: # Fim da aba
+            linhas.append({"Competição": campeonato, "Ano": "Total", "Gols": total_gols, "Assistências": total_assists})
+            total_geral_gols += total_gols
+            total_geral_assists += total_assists
+            total_gols = total_assists = 0
+
+    if linhas:
+        linhas.append({"Competição": "Total Geral", "Ano": "", "Gols": total_geral_gols, "Assistências": total_geral_assists})
+    return pd.DataFrame(linhas, columns=["Competição", "Ano", "Gols", "Assistências"])
+
+def tabela_eventos(eventos):
+    """Formata eventos como Ano (inteiro ou NA), Competição, Partida e Tipo ('Gol'/'Assistência').
+
+    A ordem é cronológica: por ano (eventos sem ano no fim) e, no mesmo ano, na ordem das abas e
+    das partidas na planilha (não há data da partida); numa partida, gols antes das assistências.
+    """
+    eventos = eventos.sort_values("ano", kind="stable", na_position="last") # Eventos já vêm na ordem da planilha
+    return pd.DataFrame({
+        "Ano": eventos["ano"].astype("Int64"),
+        "Competição": eventos["campeonato"].astype(object), # Textos, não os códigos das colunas categóricas
+        "Partida": eventos["partida"].astype(object),
+        "Tipo": eventos["tipo"].map({"gols": "Gol", "assistências": "Assistência"}).astype(object),
+    }).reset_index(drop=True)
+
+@cronometrado("análise: jogos_participacoes")
+def jogos_participacoes(base, jogador, competicao="Todas"):
+    """Um gol ou assistência do jogador por linha, em ordem cronológica (ver tabela_eventos)."""
+    abas = abas_validas(base, abas_da_competicao(base, competicao), "jogos_participacoes")
+    eventos = eventos_do_jogador(base, id_jogador(jogador, base["apelidos"]))
+    return tabela_eventos(eventos[eventos["aba"].isin(abas)])
+
+@cronometrado("análise: ranking")
+def ranking(base, competicao="Todas"):
+    """Ranking de participações na competição (ver cruzeiro_dados.calcular_ranking)."""
+    return calcular_ranking(base["cubo"], base["nomes_por_jogador"], abas=abas_da_competicao(base, competicao))
+
+@cronometrado("análise: analise_por_ano")
+def analise_por_ano(base, competicao="Todas", ano=None):
+    """Ranking de participações na competição, só no ano informado (todos os anos se None)."""
+    return calcular_ranking(base["cubo"], base["nomes_por_jogador"], abas=abas_da_competicao(base, competicao), ano=ano)
+
+@cronometrado("análise: lances_especiais")
+def lances_especiais(base, competicao="Todas", ano=None):
+    """Pênaltis, gols contra, gols de falta e gols sem assistência por competição (todos os anos se None).
+
+    Usa a classe gravada em cada evento na carga. Um lance que aparece nas colunas de gols e de
+    assistências da mesma partida (ex.: 'Gol contra' nas duas) conta uma vez. Colunas: Competição
+    e uma por classe (ROTULOS_CLASSES), com uma linha 'Total' no fim; vazio se não houver lances.
+    """
+    abas = abas_da_competicao(base, competicao)
+    eventos = base["eventos"]
+    filtro = (eventos["classe"] != "") & eventos["aba"].isin(abas)
+    if ano:
+        filtro &= eventos["ano"] == ano
+    contagem = (
+        eventos[filtro].groupby(["aba", "linha", "classe", "tipo"], observed=True).size()
+        .groupby(level=["aba", "linha", "classe"], observed=True).max() # Mesmo lance nas duas colunas
+        .groupby(level=["aba", "classe"], observed=True).sum()
+    )
+    return tabela_lances(contagem, abas)
+
+def tabela_lances(contagem, abas):
+    """Tabela de lances_especiais a partir da contagem de lances indexada por (aba, classe)."""
+    classes = list(CLASSES_TERMOS)
+    colunas = ["Competição"] + [ROTULOS_CLASSES.get(classe, classe) for classe in classes]
+    if contagem.empty:
+        return pd.DataFrame(columns=colunas)
+
+    contagem = contagem.unstack("classe", fill_value=0)
+    contagem.index = contagem.index.astype(object)
+    contagem.columns = contagem.columns.astype(object)
+    contagem = contagem.reindex(index=[aba for aba in abas if aba in contagem.index], columns=classes, fill_value=0)
+    contagem.loc["Total"] = contagem.sum()
+    resultado = contagem.astype(int).rename_axis("Competição").reset_index()
+    resultado.columns = colunas
+    return resultado
+
+def _listar_eventos(base, analise, jogador, ano=None):
+    """Gols ou assistências do jogador em todas as abas, opcionalmente só no ano informado."""
+    abas = abas_validas(base, base["abas"], analise)
+    eventos = eventos_do_jogador(base, id_jogador(jogador, base["apelidos"]))
+    filtro = (eventos["tipo"] == TIPO_EVENTO[analise]) & eventos["aba"].isin(abas)
+    if ano:
+        filtro &= eventos["ano"] == ano
+    return tabela_eventos(eventos[filtro])
+
+@cronometrado("análise: gols")
+def listar_gols(base, jogador, ano=None):
+    """Todos os gols do jogador (em todas as competições), opcionalmente só no ano informado."""
+    return _listar_eventos(base, "gols", jogador, ano)
+
+@cronometrado("análise: assistencias")
+def listar_assistencias(base, jogador, ano=None):
+    """Todas as assistências do jogador (em todas as competições), opcionalmente só no ano informado."""
+    return _listar_eventos(base, "assistencias", jogador, ano)
+
+# Chave interna da análise (valores de ANALISES_DISPONIVEIS no app) -> função
+ANALISES = {
+    "numeros_gerais": numeros_gerais,
+    "jogos_participacoes": jogos_participacoes,
+    "ranking": ranking,
+    "analise_por_ano": analise_por_ano,
+    "lances_especiais": lances_especiais,
+    "gols": listar_gols,
+    "assistencias": listar_assistencias,
+}
+
+# Análises que dependem de um jogador (as demais são rankings)
+ANALISES_POR_JOGADOR = ["numeros_gerais", "jogos_participacoes", "gols", "assistencias"]
+
+def executar_analise(base, analise, jogador=None, competicao="Todas", ano=None):
+    """Executa a análise pela chave interna, repassando só os filtros que ela aceita.
+
+    Bases abertas de um banco SQLite (com a chave 'banco', ver cruzeiro_sql.carregar_banco) são
+    consultadas com as versões SQL das análises, que devolvem as mesmas tabelas.
+    """
+    analises = ANALISES
+    if "banco" in base:
+        from cruzeiro_sql import ANALISES_SQL # Importado aqui: cruzeiro_sql usa os filtros deste módulo
+        analises = ANALISES_SQL
+    if analise in ["numeros_gerais", "jogos_participacoes"]:
+        return analises[analise](base, jogador, competicao)
+    if analise in TIPO_EVENTO:
+        return analises[analise](base, jogador, ano)
+    if analise == "ranking":
+        return analises[analise](base, competicao)
+    if analise in ["analise_por_ano", "lances_especiais"]:
+        return analises[analise](base, competicao, ano)
+    raise ValueError(f"Análise desconhecida: '{analise}'")
@@ -0,0 +1,309 @@
+# -*- coding: utf-8 -*-
+"""API HTTP/JSON local das análises, sem Streamlit (asyncio, só biblioteca padrão).
+
+Uso:
+    python cruzeiro_api.py --porta 8000
+
+Rotas (GET):
+    /analises                       Chaves das análises e os parâmetros que cada uma aceita
+    /analises/<chave>?jogador=&competicao=&ano=
+                                    Resultado da análise: {"parametros", "avisos", "dados"}
+    /jogadores, /competicoes        Opções de jogador e de competição (como nos seletores do app)
+    /estatisticas                   Contadores do cache de respostas e das recargas da planilha,
+                                    e tempos por etapa (ver cruzeiro_diagnostico)
+
+A planilha é carregada uma vez e compartilhada por todas as requisições; quando ela (ou o
+arquivo de apelidos) muda, a base é recarregada (snapshot/recarga incremental, ver cruzeiro_dados.carregar_base)
+e o cache de respostas é esvaziado. Com --banco (ou CRUZEIRO_BACKEND=sqlite), as análises são
+consultas ao banco SQLite importado (ver cruzeiro_sql), acompanhado da mesma forma.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import time
+from collections import OrderedDict
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from cruzeiro_analises import ANALISES, ANALISES_POR_JOGADOR, avisos_analise, executar_analise
+from cruzeiro_dados import assinatura_apelidos, carregar_base, id_jogador
+from cruzeiro_diagnostico import tempos_etapas
+from cruzeiro_sql import caminho_banco, carregar_banco, usar_banco
+
+# Parâmetros que cada análise usa; os demais são ignorados (e não entram na chave do cache)
+PARAMETROS_POR_ANALISE = {
+    "numeros_gerais": ["jogador", "competicao"],
+    "jogos_participacoes": ["jogador", "competicao"],
+    "ranking": ["competicao"],
+    "analise_por_ano": ["competicao", "ano"],
+    "lances_especiais": ["competicao", "ano"],
+    "gols": ["jogador", "ano"],
+    "assistencias": ["jogador", "ano"],
+}
+
+STATUS_HTTP = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 500: "Internal Server Error"}
+
+class ErroRequisicao(Exception):
+    """Erro do cliente, respondido com o status HTTP e a mensagem em JSON."""
+
+    def __init__(self, status, mensagem):
+        super().__init__(mensagem)
+        self.status = status
+
+class CacheRespostas:
+    """Cache LRU com validade (TTL) das respostas já serializadas, com contadores de acertos e falhas."""
+
+    def __init__(self, maximo=256, ttl=300):
+        self.maximo = maximo
+        self.ttl = ttl
+        self.itens = OrderedDict() # chave -> (instante de expiração, corpo da resposta)
+        self.acertos = 0
+        self.falhas = 0
+        self.agrupadas = 0 # Faltas que esperaram o cálculo já em andamento da mesma chave, sem recalcular
+
+    def obter(self, chave):
+        """Corpo guardado para a chave, ou None se não houver ou tiver expirado."""
+        item = self.itens.get(chave)
+        if item is None or item[0] < time.monotonic():
+            if item is not None:
+                del self.itens[chave]
+            self.falhas += 1
+            return None
+        self.itens.move_to_end(chave)
+        self.acertos += 1
+        return item[1]
+
+    def guardar(self, chave, corpo):
+        """Guarda o corpo, descartando o item usado há mais tempo quando o cache está cheio."""
+        self.itens[chave] = (time.monotonic() + self.ttl, corpo)
+        self.itens.move_to_end(chave)
+        while len(self.itens) > self.maximo:
+            self.itens.popitem(last=False)
+
+    def agrupar(self):
+        """Conta como agrupada a última falta, que vai esperar o cálculo em andamento em vez de calcular."""
+        self.falhas -= 1
+        self.agrupadas += 1
+
+    def limpar(self):
+        self.itens.clear()
+
+    def estatisticas(self):
+        consultas = self.acertos + self.agrupadas + self.falhas
+        return {
+            "itens": len(self.itens), "maximo": self.maximo, "ttl": self.ttl,
+            "acertos": self.acertos, "agrupadas": self.agrupadas, "falhas": self.falhas,
+            # As agrupadas também não calcularam nada
+            "taxa_acertos": (self.acertos + self.agrupadas) / consultas if consultas else None,
+        }
+
+# --- Base compartilhada ---
+
+def criar_estado(arquivo, maximo_cache=256, ttl=300, banco=None):
+    """Estado do servidor: a base carregada, a assinatura do arquivo e o cache de respostas.
+
+    Com banco, a base vem do banco SQLite (ver cruzeiro_sql.carregar_banco) em vez da planilha.
+    """
+    return {
+        "arquivo": arquivo,
+        "banco": banco,
+        "base": None,
+        "stat": None, # (mtime_ns, tamanho) da planilha e dos apelidos (ou do banco) quando a base foi carregada
+        "recargas": 0,
+        "cache": CacheRespostas(maximo_cache, ttl),
+        "pendentes": {}, # chave do cache -> Future das respostas em cálculo
+        "trava": asyncio.Lock(),
+    }
+
+def _stat_fonte(estado):
+    """(mtime_ns, tamanho) do banco ou, sem banco, da planilha com a assinatura dos apelidos."""
+    if estado["banco"]:
+        stat = os.stat(estado["banco"]) # Os apelidos já estão no banco importado
+        return stat.st_mtime_ns, stat.st_size
+    stat = os.stat(estado["arquivo"])
+    return stat.st_mtime_ns, stat.st_size, assinatura_apelidos(estado["arquivo"])
+
+def _carregar(estado):
+    """Carrega a base da fonte do servidor (banco SQLite ou planilha)."""
+    if estado["banco"]:
+        return carregar_banco(estado["banco"])
+    return carregar_base(estado["arquivo"])
+
+async def base_atual(estado):
+    """Base atual; recarrega (uma vez, mesmo com requisições simultâneas) se o arquivo mudou."""
+    try:
+        stat = _stat_fonte(estado)
+    except OSError:
+        if estado["base"] is None:
+            raise
+        return estado["base"] # Arquivo sendo substituído: continua com a base anterior
+
+    if stat != estado["stat"]:
+        async with estado["trava"]:
+            if stat != estado["stat"]:
+                estado["base"] = await asyncio.to_thread(_carregar, estado)
+                estado["stat"] = stat
+                estado["recargas"] += 1
+                estado["cache"].limpar()
+    return estado["base"]
+
+# --- Rotas ---
+
+def _parametros(analise, consulta):
+    """Parâmetros da análise a partir da query string, validados e normalizados."""
+    parametros = {}
+    if "jogador" in PARAMETROS_POR_ANALISE[analise]:
+        jogador = consulta.get("jogador", [""])[0].strip()
+        if not jogador:
+            raise ErroRequisicao(400, f"A análise '{analise}' exige o parâmetro 'jogador'.")
+        parametros["jogador"] = jogador
+    if "competicao" in PARAMETROS_POR_ANALISE[analise]:
+        parametros["competicao"] = consulta.get("competicao", ["Todas"])[0] or "Todas"
+    if "ano" in PARAMETROS_POR_ANALISE[analise]:
+        ano = consulta.get("ano", [""])[0].strip()
+        try:
+            parametros["ano"] = int(ano) if ano else None
+        except ValueError:
+            raise ErroRequisicao(400, f"Ano inválido: '{ano}'.")
+    return parametros
+
+def _calcular_resposta(base, analise, parametros):
+    """Executa a análise e serializa avisos e dados, o trecho guardado no cache (roda fora do loop de eventos)."""
+    dados = executar_analise(base, analise, **parametros)
+    avisos = avisos_analise(base, analise, parametros.get("competicao", "Todas"), parametros.get("ano"))
+    # Os registros vêm do pandas (NA -> null); só são encaixados no objeto JSON
+    return ('"avisos": ' + json.dumps(avisos, ensure_ascii=False) + ', "dados": ' + dados.to_json(orient="records", force_ascii=False) + "}").encode("utf-8")
+
+async def responder_analise(estado, analise, consulta):
+    """Resposta da análise, do cache ou calculada (uma vez por chave, mesmo com requisições simultâneas)."""
+    if analise not in ANALISES:
+        raise ErroRequisicao(404, f"Análise desconhecida: '{analise}'.")
+    parametros = _parametros(analise, consulta)
+    base = await base_atual(estado)
+    # Cada resposta repete os parâmetros da própria requisição; o resto vem do cache
+    cabecalho = json.dumps({"analise": analise, "parametros": parametros}, ensure_ascii=False)[:-1].encode("utf-8") + b", "
+
+    # O motor compara jogadores pelo id canônico, então 'Jussiê', ' jussie ' e os apelidos são a mesma consulta
+    chave = (analise,) + tuple(id_jogador(v, base["apelidos"]) if k == "jogador" else v for k, v in sorted(parametros.items()))
+    corpo = estado["cache"].obter(chave)
+    if corpo is not None:
+        return cabecalho + corpo
+    if chave in estado["pendentes"]:
+        estado["cache"].agrupar()
+        return cabecalho + await asyncio.shield(estado["pendentes"][chave])
+
+    futuro = asyncio.get_running_loop().create_future()
+    estado["pendentes"][chave] = futuro
+    try:
+        corpo = await asyncio.to_thread(_calcular_resposta, base, analise, parametros)
+        if base is estado["base"]: # Não guarda resultados de uma base que foi trocada no meio do cálculo
+            estado["cache"].guardar(chave, corpo)
+        futuro.set_result(corpo)
+        return cabecalho + corpo
+    except Exception as erro:
+        futuro.set_exception(erro)
+        futuro.exception() # Evita o aviso de exceção não lida quando ninguém mais esperava
+        raise
+    finally:
+        del estado["pendentes"][chave]
+
+def _json(objeto):
+    return json.dumps(objeto, ensure_ascii=False).encode("utf-8")
+
+async def rotear(estado, caminho, consulta):
+    """Corpo JSON da resposta para o caminho pedido."""
+    partes = [unquote(p) for p in caminho.strip("/").split("/") if p]
+    if partes == ["analises"]:
+        return _json({
+            analise: {"parametros": PARAMETROS_POR_ANALISE[analise], "por_jogador": analise in ANALISES_POR_JOGADOR}
+            for analise in ANALISES
+        })
+    if len(partes) == 2 and partes[0] == "analises":
+        return await responder_analise(estado, partes[1], consulta)
+    if partes == ["jogadores"]:
+        return _json((await base_atual(estado))["nomes_jogadores"])
+    if partes == ["competicoes"]:
+        return _json(["Todas"] + list((await base_atual(estado))["abas"]))
+    if partes == ["estatisticas"]:
+        return _json({
+            "cache": estado["cache"].estatisticas(), "recargas": estado["recargas"],
+            "calculando": len(estado["pendentes"]), "tempos": tempos_etapas(),
+        })
+    raise ErroRequisicao(404, f"Rota desconhecida: '{caminho}'.")
+
+# --- HTTP ---
+
+async def _escrever_resposta(writer, status, corpo, manter_conexao):
+    cabecalhos = (
+        f"HTTP/1.1 {status} {STATUS_HTTP[status]}\r\n"
+        "Content-Type: application/json; charset=utf-8\r\n"
+        f"Content-Length: {len(corpo)}\r\n"
+        f"Connection: {'keep-alive' if manter_conexao else 'close'}\r\n\r\n"
+    )
+    writer.write(cabecalhos.encode("ascii") + corpo)
+    await writer.drain()
+
+async def tratar_conexao(estado, reader, writer):
+    """Atende as requisições de uma conexão (HTTP/1.1 com keep-alive, só GET e sem corpo)."""
+    try:
+        while True:
+            linha = await reader.readline()
+            if not linha.strip():
+                break
+            try:
+                metodo, alvo, versao = linha.decode("latin-1").split()
+            except ValueError:
+                await _escrever_resposta(writer, 400, _json({"erro": "Requisição malformada."}), False)
+                break
+            cabecalhos = {}
+            while (cabecalho := await reader.readline()) not in (b"\r\n", b"\n", b""):
+                nome, _, valor = cabecalho.decode("latin-1").partition(":")
+                cabecalhos[nome.strip().lower()] = valor.strip().lower()
+            manter_conexao = cabecalhos.get("connection", "keep-alive" if versao == "HTTP/1.1" else "close") != "close"
+
+            if metodo != "GET":
+                status, corpo = 405, _json({"erro": "Só o método GET é aceito."})
+            else:
+                url = urlsplit(alvo)
+                try:
+                    status, corpo = 200, await rotear(estado, url.path, parse_qs(url.query))
+                except ErroRequisicao as erro:
+                    status, corpo = erro.status, _json({"erro": str(erro)})
+                except Exception as erro:
+                    status, corpo = 500, _json({"erro": f"Erro ao processar a requisição: {erro}"})
+            await _escrever_resposta(writer, status, corpo, manter_conexao)
+            if not manter_conexao:
+                break
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+    finally:
+        writer.close()
+
+async def servir(arquivo, host="127.0.0.1", porta=8000, maximo_cache=256, ttl=300, banco=None):
+    """Carrega a base e atende requisições até ser interrompido."""
+    estado = criar_estado(arquivo, maximo_cache, ttl, banco)
+    await base_atual(estado) # Carrega antes de aceitar conexões
+    servidor = await asyncio.start_server(lambda r, w: tratar_conexao(estado, r, w), host, porta)
+    print(f"API das análises de '{banco or arquivo}' em http://{host}:{porta}/analises")
+    async with servidor:
+        await servidor.serve_forever()
+
+def main(argv=None):
+    """CLI: sobe a API local."""
+    parser = argparse.ArgumentParser(description="API HTTP/JSON local das análises.")
+    parser.add_argument("arquivo", nargs="?", default="Cruzeiro Mineiro.xlsx", help="Planilha de origem (padrão: %(default)s)")
+    parser.add_argument("--host", default="127.0.0.1", help="Endereço (padrão: %(default)s)")
+    parser.add_argument("--porta", type=int, default=8000, help="Porta (padrão: %(default)s)")
+    parser.add_argument("--cache", type=int, default=256, help="Máximo de respostas no cache (padrão: %(default)s)")
+    parser.add_argument("--ttl", type=float, default=300, help="Validade das respostas no cache, em segundos (padrão: %(default)s)")
+    parser.add_argument("--banco", default=None, help="Consulta este banco SQLite em vez da planilha (padrão com CRUZEIRO_BACKEND=sqlite: '<planilha>.sqlite')")
+    args = parser.parse_args(argv)
+    banco = args.banco or (caminho_banco(args.arquivo) if usar_banco() else None)
+    try:
+        asyncio.run(servir(args.arquivo, args.host, args.porta, args.cache, args.ttl, banco))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
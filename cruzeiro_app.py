@@ -1,540 +1,414 @@
-# -*- coding: utf-8 -*- # Adicionado para garantir compatibilidade de caracteres
-
-import streamlit as st
-import pandas as pd
-import os # Importar o módulo os para verificar a existência do arquivo
-
-# --- Configurações Iniciais e Constantes ---
-
-# Opção 1: Usar o nome do arquivo (caminho relativo).
-#           NECESSÁRIO para deploy no Streamlit Cloud/GitHub.
-#           O arquivo Excel DEVE estar na mesma pasta do script no repositório.
-ARQUIVO_EXCEL = "Cruzeiro Mineiro.xlsx"
-
-# Opção 2: Usar o caminho absoluto (NÃO USAR PARA DEPLOY)
-# ARQUIVO_EXCEL = r"C:\Caminho\Para\Seu\Arquivo\Local\Cruzeiro Mineiro.xlsx" # MANTENHA COMENTADO PARA DEPLOY
-
-TERMOS_IGNORADOS = ["Penalti", "Sem ass", "Falta", "Gol contra"] # Mantido em minúsculas para comparação case-insensitive
-
-ANALISES_DISPONIVEIS = {
-    "Números Gerais (por jogador)": "numeros_gerais",
-    "Jogos com Participações (por jogador)": "jogos_participacoes",
-    "Ranking Geral (por competição)": "ranking", # Ajustado nome para clareza
-    "Análise por Ano (Ranking)": "analise_por_ano",
-    "Listar Gols (por jogador)": "gols",
-    "Listar Assistências (por jogador)": "assistencias"
-}
-
-# --- Funções Auxiliares ---
-
-@st.cache_resource # Usar cache de recurso para o objeto ExcelFile
-def carregar_dados_excel(arquivo):
-    """Carrega o arquivo Excel como um recurso e retorna o objeto ExcelFile."""
-    # No ambiente de deploy, st.info/success podem poluir menos
-    # st.info(f"Tentando carregar o recurso do arquivo: {arquivo}")
-    if not os.path.exists(arquivo):
-        # No deploy, talvez seja melhor logar o erro internamente
-        st.error(f"❌ Erro Fatal: Arquivo '{arquivo}' NÃO ENCONTRADO no repositório.")
-        st.error("Certifique-se de que o arquivo Excel foi enviado para o GitHub na mesma pasta que o script Python.")
-        return None # Retorna None se não encontrar
-    try:
-        # Abrir o arquivo Excel como um recurso
-        xls = pd.ExcelFile(arquivo)
-        # st.success(f"Recurso do arquivo '{os.path.basename(arquivo)}' carregado com sucesso!")
-        return xls
-    except FileNotFoundError: # Redundante se os.path.exists funcionar, mas seguro ter
-        st.error(f"❌ Erro: Arquivo '{arquivo}' não encontrado (FileNotFoundError).")
-        return None
-    except Exception as e:
-        st.error(f"❌ Erro ao carregar o recurso do arquivo Excel '{arquivo}': {e}")
-        st.error("Verifique se o arquivo Excel não está corrompido ou se é um formato válido.")
-        return None
-
-def obter_competicoes(xls):
-    """Retorna a lista de nomes das abas (competições) com 'Todas' no início."""
-    if xls:
-        try:
-            # Garante que sheet_names seja uma lista antes de concatenar
-            sheet_names = xls.sheet_names if isinstance(xls.sheet_names, list) else list(xls.sheet_names)
-            return ["Todas"] + sheet_names
-        except Exception as e:
-            st.error(f"Erro ao ler os nomes das abas do Excel: {e}")
-            return ["Todas"]
-    return ["Todas"] # Retorna 'Todas' mesmo se o arquivo não carregar
-
-def limpar_nome(nome):
-    """Remove espaços extras e converte para minúsculas para comparação."""
-    return str(nome).strip().lower()
-
-def verificar_participacao(texto, jogador_limpo):
-    """Verifica se o jogador participou (gol/assist) e conta as ocorrências, ignorando termos."""
-    if not isinstance(texto, str) or not jogador_limpo:
-        return 0
-    count = 0
-    participacoes = texto.split(";")
-    for p in participacoes:
-        p_limpo = limpar_nome(p)
-        # Verifica se é o jogador E não contém nenhum termo ignorado (case-insensitive)
-        # Atenção à lógica: 'in' verifica substrings. Melhor comparar igualdade.
-        e_jogador = (p_limpo == jogador_limpo)
-        tem_termo_ignorado = any(limpar_nome(term) in p_limpo for term in TERMOS_IGNORADOS)
-
-        if e_jogador and not tem_termo_ignorado:
-            count += 1
-    return count
-
-# --- Interface do Streamlit (Sidebar para Controles) ---
-st.set_page_config(page_title="Análise Cruzeiro", page_icon="🦊", layout="wide") # Configura título e layout
-
-st.sidebar.title("Análise de Dados - Cruzeiro 🦊")
-# Tenta carregar a imagem localmente ou de URL (mais seguro para deploy)
-try:
-    # Se tiver a imagem no repo:
-    # st.sidebar.image("logo_cruzeiro.png", width=100)
-    # Ou usar uma URL pública:
-    st.sidebar.image("https://upload.wikimedia.org/wikipedia/commons/thumb/9/90/Cruzeiro_Esporte_Clube_%28logo%29.svg/1200px-Cruzeiro_Esporte_Clube_%28logo%29.svg.png", width=100)
-except Exception:
-    st.sidebar.warning("Não foi possível carregar o logo.")
-
-
-# --- Carregamento dos Dados ---
-# Chamada da função que usa @st.cache_resource
-xls = carregar_dados_excel(ARQUIVO_EXCEL)
-
-# --- VERIFICAÇÃO CRÍTICA ---
-if xls is None:
-    st.warning("⛔ A aplicação não pode continuar sem os dados do Excel.")
-    st.info("Verifique as mensagens de erro acima. O arquivo 'Cruzeiro Mineiro.xlsx' precisa estar no repositório GitHub junto com este script.")
-    st.stop() # Interrompe a execução do script se o arquivo não foi carregado
-
-# --- Continua com o restante da interface e lógica ---
-competicoes = obter_competicoes(xls)
-
-tipo_analise_display = st.sidebar.selectbox(
-    "Escolha o tipo de análise:",
-    options=list(ANALISES_DISPONIVEIS.keys()),
-    key="tipo_analise_select" # Adiciona chave para evitar problemas de estado
-)
-tipo_analise = ANALISES_DISPONIVEIS[tipo_analise_display] # Mapeia de volta para a chave interna
-
-# --- Inputs Condicionais na Sidebar ---
-ano_escolhido_input = None
-competicao_escolhida = "Todas" # Default para 'Todas'
-jogador_escolhido = None
-
-# Input de Competição
-if tipo_analise not in ["gols", "assistencias"]:
-     competicao_escolhida = st.sidebar.selectbox(
-        "Selecione a Competição:",
-        options=competicoes,
-        index=0, # Começa com 'Todas' selecionado
-        key="competicao_select"
-    )
-
-# Input de Ano
-if tipo_analise in ["analise_por_ano", "gols", "assistencias"]:
-    ano_escolhido_input = st.sidebar.text_input("Digite o Ano (ex: 2023, deixe em branco para todos):", key="ano_input")
-
-# Input de Jogador
-if tipo_analise not in ["ranking", "analise_por_ano"]:
-    jogador_escolhido = st.sidebar.text_input("Digite o nome exato do Jogador:", key="jogador_input").strip()
-
-# --- Validação e Processamento do Ano ---
-ano_filtrar = None
-if ano_escolhido_input:
-    try:
-        ano_filtrar = int(ano_escolhido_input)
-    except ValueError:
-        st.sidebar.warning(f"'{ano_escolhido_input}' não é um ano válido. Mostrando todos os anos.")
-
-# --- Lógica Principal e Exibição dos Resultados ---
-st.header(f"📊 Resultados: {tipo_analise_display}")
-
-# Determina as abas a serem analisadas
-abas_para_analisar = []
-# Verifica se xls não é None antes de acessar sheet_names
-if xls:
-    if competicao_escolhida and competicao_escolhida != "Todas":
-        if competicao_escolhida in xls.sheet_names:
-            abas_para_analisar = [competicao_escolhida]
-        else:
-            # Isso não deve acontecer se 'competicoes' foi gerado corretamente
-            st.warning(f"Competição '{competicao_escolhida}' selecionada mas não encontrada.")
-    elif competicao_escolhida == "Todas" or tipo_analise in ["gols", "assistencias"]:
-        abas_para_analisar = xls.sheet_names
-    else: # Fallback caso algo estranho ocorra
-         abas_para_analisar = xls.sheet_names
-else:
-    # xls é None, já tratado antes com st.stop(), mas por segurança:
-    st.error("Erro interno: Objeto Excel não está carregado.")
-    st.stop()
-
-
-# --- Execução da Análise Escolhida ---
-
-# Adiciona uma verificação se há abas para analisar
-if not abas_para_analisar and competicao_escolhida != "Todas":
-     st.warning(f"Nenhuma aba encontrada para a competição '{competicao_escolhida}'.")
-     # st.stop() # Decide se quer parar ou continuar (pode não exibir nada)
-elif not abas_para_analisar and competicao_escolhida == "Todas":
-     st.warning("Nenhuma aba/competição encontrada no arquivo Excel.")
-     st.stop()
-
-
-# 1. Números Gerais (por jogador)
-if tipo_analise == "numeros_gerais":
-    if not jogador_escolhido:
-        st.info("👈 Por favor, digite o nome de um jogador na barra lateral.")
-    else:
-        st.subheader(f"Números Gerais de {jogador_escolhido.title()}")
-        # ... (resto da lógica como estava antes)
-        resultados_gerais = []
-        jogador_limpo = limpar_nome(jogador_escolhido)
-        total_geral_gols = 0
-        total_geral_assists = 0
-
-        with st.spinner(f"Analisando dados de {jogador_escolhido.title()}..."): # Feedback visual
-            for aba in abas_para_analisar:
-                try:
-                    df = pd.read_excel(xls, sheet_name=aba)
-                    df.columns = [limpar_nome(col) for col in df.columns] # Limpa nomes das colunas
-
-                    cols_essenciais = ['gols', 'assistências', 'campeonato', 'ano']
-                    colunas_faltando = [c for c in cols_essenciais if c not in df.columns]
-                    if colunas_faltando:
-                        st.warning(f"⚠️ Aba '{aba}': Faltando colunas: {', '.join(colunas_faltando)}. Pulando.")
-                        continue
-
-                    df['gols_jogador'] = df['gols'].apply(lambda x: verificar_participacao(x, jogador_limpo))
-                    df['assists_jogador'] = df['assistências'].apply(lambda x: verificar_participacao(x, jogador_limpo))
-
-                    df['ano'] = pd.to_numeric(df['ano'], errors='coerce')
-                    df.dropna(subset=['ano'], inplace=True) # Remove anos inválidos
-                    df['ano'] = df['ano'].astype(int)
-
-                    resumo_aba = df.groupby(['campeonato', 'ano'])[['gols_jogador', 'assists_jogador']].sum().reset_index()
-                    resumo_aba = resumo_aba[(resumo_aba['gols_jogador'] > 0) | (resumo_aba['assists_jogador'] > 0)]
-
-                    if not resumo_aba.empty:
-                        total_camp_gols = resumo_aba['gols_jogador'].sum()
-                        total_camp_assists = resumo_aba['assists_jogador'].sum()
-                        nome_campeonato_atual = "" # Para armazenar o nome do último camp processado
-                        for _, row in resumo_aba.iterrows():
-                            nome_campeonato_atual = row['campeonato']
-                            resultados_gerais.append({
-                                "Competição": nome_campeonato_atual,
-                                "Ano": int(row['ano']),
-                                "Gols": int(row['gols_jogador']),
-                                "Assistências": int(row['assists_jogador'])
-                            })
-                        # Adiciona total do campeonato (usa nome_campeonato_atual)
-                        if nome_campeonato_atual: # Garante que houve pelo menos uma linha
-                            resultados_gerais.append({
-                                "Competição": nome_campeonato_atual,
-                                "Ano": "Total",
-                                "Gols": int(total_camp_gols),
-                                "Assistências": int(total_camp_assists)
-                            })
-                        total_geral_gols += total_camp_gols
-                        total_geral_assists += total_camp_assists
-
-                except Exception as e:
-                    st.error(f"⚠️ Erro ao processar a aba '{aba}' para Números Gerais: {e}")
-
-        if resultados_gerais:
-            df_resultados = pd.DataFrame(resultados_gerais)
-            if total_geral_gols > 0 or total_geral_assists > 0:
-                 df_total_geral = pd.DataFrame([{"Competição": "Total Geral", "Ano": "", "Gols": int(total_geral_gols), "Assistências": int(total_geral_assists)}])
-                 # Usar pd.concat para adicionar a linha de total geral
-                 df_resultados = pd.concat([df_resultados, df_total_geral], ignore_index=True)
-
-
-            st.dataframe(
-                df_resultados.style.format({
-                    "Ano": lambda x: "" if pd.isna(x) or x == "Total" or x == "" else f"{x:.0f}", # Formata ano
-                    "Gols": "{:.0f}",
-                    "Assistências": "{:.0f}"
-                 }).apply(lambda x: ['background-color: #eee; font-weight: bold;' if x.name == len(df_resultados)-1 else '' for i in x], axis=1 # Destaca Total Geral
-                 ).apply(lambda x: ['font-weight: bold;' if x.Ano == "Total" else '' for i in x], axis=1), # Negrito nos Totais de Competição
-                 use_container_width=True,
-                 hide_index=True # Esconde o índice numérico padrão
-            )
-        elif jogador_escolhido: # Só mostra essa mensagem se um jogador foi inserido
-            st.info(f"Nenhuma participação em gols ou assistências encontrada para '{jogador_escolhido.title()}' nos filtros selecionados.")
-
-# 2. Jogos com Participações (por jogador)
-elif tipo_analise == "jogos_participacoes":
-    if not jogador_escolhido:
-        st.info("👈 Por favor, digite o nome de um jogador na barra lateral.")
-    else:
-        st.subheader(f"Jogos com Participação em Gols/Assistências de {jogador_escolhido.title()}")
-        # ... (resto da lógica como estava antes)
-        jogos_encontrados = []
-        jogador_limpo = limpar_nome(jogador_escolhido)
-
-        with st.spinner(f"Buscando jogos de {jogador_escolhido.title()}..."):
-            for aba in abas_para_analisar:
-                try:
-                    df = pd.read_excel(xls, sheet_name=aba)
-                    df.columns = [limpar_nome(col) for col in df.columns]
-
-                    cols_essenciais = ['gols', 'assistências', 'partida', 'campeonato', 'ano']
-                    colunas_faltando = [c for c in cols_essenciais if c not in df.columns]
-                    if colunas_faltando:
-                        st.warning(f"⚠️ Aba '{aba}': Faltando colunas: {', '.join(colunas_faltando)}. Pulando.")
-                        continue
-
-                    df['ano'] = pd.to_numeric(df['ano'], errors='coerce')
-
-                    df_potencial = df[
-                        df['gols'].astype(str).str.contains(jogador_escolhido, case=False, na=False, regex=False) |
-                        df['assistências'].astype(str).str.contains(jogador_escolhido, case=False, na=False, regex=False)
-                    ].copy()
-
-                    if not df_potencial.empty:
-                        df_potencial['num_gols'] = df_potencial['gols'].apply(lambda x: verificar_participacao(x, jogador_limpo))
-                        df_potencial['num_assists'] = df_potencial['assistências'].apply(lambda x: verificar_participacao(x, jogador_limpo))
-                        df_filtrado = df_potencial[(df_potencial['num_gols'] > 0) | (df_potencial['num_assists'] > 0)]
-
-                        for _, row in df_filtrado.iterrows():
-                            try:
-                                ano_str = f"{int(row['ano'])}" if pd.notna(row['ano']) else "N/A"
-                            except (ValueError, TypeError):
-                                ano_str = row.get('ano', 'N/A')
-
-                            campeonato = row.get('campeonato', 'N/A')
-                            partida = row.get('partida', 'N/A')
-                            num_gols = row['num_gols']
-                            num_assists = row['num_assists']
-
-                            for _ in range(num_gols):
-                                jogos_encontrados.append(f"⚽ **Gol:** {ano_str} - {campeonato} - {partida}")
-                            for _ in range(num_assists):
-                                jogos_encontrados.append(f"👟 **Assistência:** {ano_str} - {campeonato} - {partida}")
-
-                except Exception as e:
-                    st.error(f"⚠️ Erro ao processar a aba '{aba}' para Jogos com Participações: {e}")
-
-        if jogos_encontrados:
-            # Ordena a lista antes de exibir e numera
-            jogos_encontrados.sort()
-            jogos_formatados = [f"{i+1}. {item}" for i, item in enumerate(jogos_encontrados)]
-            st.markdown("\n".join(jogos_formatados))
-        elif jogador_escolhido:
-            st.info(f"Nenhuma participação encontrada para '{jogador_escolhido.title()}' nos filtros selecionados.")
-
-# 3. Ranking Geral (por competição)
-elif tipo_analise == "ranking":
-    comp_selecionada = competicao_escolhida if competicao_escolhida else "Todas" # Deveria ser 'Todas' ou uma competição
-    st.subheader(f"Ranking de Participações - Competição: {comp_selecionada}")
-    # ... (resto da lógica como estava antes)
-    player_stats = {}
-
-    with st.spinner(f"Calculando ranking para {comp_selecionada}..."):
-        for aba in abas_para_analisar: # abas_para_analisar foi definido baseado na seleção
-            try:
-                df = pd.read_excel(xls, sheet_name=aba)
-                df.columns = [limpar_nome(col) for col in df.columns]
-
-                if 'gols' not in df.columns and 'assistências' not in df.columns:
-                    st.warning(f"⚠️ Aba '{aba}': Faltando 'gols' e 'assistências'. Pulando para ranking.")
-                    continue
-
-                for index, row in df.iterrows():
-                    if 'gols' in df.columns and isinstance(row['gols'], str):
-                        gols_list = [p.strip() for p in row['gols'].split(";") if p.strip()]
-                        for p in gols_list:
-                            p_nome_original = p
-                            p_limpo = limpar_nome(p)
-                            if p_limpo and p_limpo != 'nan' and not any(limpar_nome(term) in p_limpo for term in TERMOS_IGNORADOS):
-                                player_stats[p_nome_original] = player_stats.get(p_nome_original, {'Gols': 0, 'Assistências': 0})
-                                player_stats[p_nome_original]['Gols'] += 1
-                    if 'assistências' in df.columns and isinstance(row['assistências'], str):
-                        assists_list = [p.strip() for p in row['assistências'].split(";") if p.strip()]
-                        for p in assists_list:
-                            p_nome_original = p
-                            p_limpo = limpar_nome(p)
-                            if p_limpo and p_limpo != 'nan' and not any(limpar_nome(term) in p_limpo for term in TERMOS_IGNORADOS):
-                                player_stats[p_nome_original] = player_stats.get(p_nome_original, {'Gols': 0, 'Assistências': 0})
-                                player_stats[p_nome_original]['Assistências'] += 1
-
-            except Exception as e:
-                st.error(f"⚠️ Erro ao processar a aba '{aba}' para Ranking: {e}")
-
-    if player_stats:
-        ranking_lista = []
-        for player, stats in player_stats.items():
-            total = stats['Gols'] + stats['Assistências']
-            if total > 0:
-                ranking_lista.append({
-                    "Jogador": player,
-                    "Gols": stats['Gols'],
-                    "Assistências": stats['Assistências'],
-                    "Total Participações": total
-                })
-
-        if ranking_lista:
-            ranking_lista = sorted(ranking_lista, key=lambda x: (x['Total Participações'], x['Gols'], x['Assistências']), reverse=True)
-            df_ranking = pd.DataFrame(ranking_lista)
-            # Adiciona coluna de Rank
-            df_ranking.insert(0, 'Rank', range(1, len(df_ranking) + 1))
-            st.dataframe(df_ranking, use_container_width=True, hide_index=True)
-        else:
-             st.info(f"Nenhum jogador com participação válida encontrado para a competição '{comp_selecionada}'.")
-    else:
-        st.info(f"Nenhum dado de participação encontrado para a competição '{comp_selecionada}'.")
-
-# 4. Análise por Ano (Ranking)
-elif tipo_analise == "analise_por_ano":
-    ano_str = str(ano_filtrar) if ano_filtrar else "Todos os Anos"
-    comp_str = competicao_escolhida if competicao_escolhida and competicao_escolhida != "Todas" else "Todas Competições"
-    st.subheader(f"Ranking de Participações - Ano: {ano_str} / Competição: {comp_str}")
-    # ... (resto da lógica como estava antes)
-    player_stats_ano = {}
-
-    with st.spinner(f"Calculando ranking para Ano: {ano_str} / Competição: {comp_str}..."):
-        for aba in abas_para_analisar: # abas_para_analisar já foi filtrada se comp != 'Todas'
-            try:
-                df = pd.read_excel(xls, sheet_name=aba)
-                df.columns = [limpar_nome(col) for col in df.columns]
-
-                if 'ano' not in df.columns:
-                    if ano_filtrar:
-                        st.warning(f"⚠️ Aba '{aba}': Faltando coluna 'ano'. Pulando para ranking anual.")
-                        continue
-                    else:
-                         df['ano'] = pd.NA
-                else:
-                    df['ano'] = pd.to_numeric(df['ano'], errors='coerce')
-
-                if ano_filtrar:
-                    df_filtrada = df[df['ano'] == ano_filtrar].copy()
-                else:
-                    df_filtrada = df.copy()
-
-                if df_filtrada.empty:
-                    continue
-
-                if 'gols' not in df_filtrada.columns and 'assistências' not in df_filtrada.columns:
-                    st.warning(f"⚠️ Aba '{aba}' (filtrada): Faltando 'gols' e 'assistências'. Pulando.")
-                    continue
-
-                for index, row in df_filtrada.iterrows():
-                    if 'gols' in df_filtrada.columns and isinstance(row['gols'], str):
-                        gols_list = [p.strip() for p in row['gols'].split(";") if p.strip()]
-                        for p in gols_list:
-                            p_nome_original = p
-                            p_limpo = limpar_nome(p)
-                            if p_limpo and p_limpo != 'nan' and not any(limpar_nome(term) in p_limpo for term in TERMOS_IGNORADOS):
-                                player_stats_ano[p_nome_original] = player_stats_ano.get(p_nome_original, {'Gols': 0, 'Assistências': 0})
-                                player_stats_ano[p_nome_original]['Gols'] += 1
-                    if 'assistências' in df_filtrada.columns and isinstance(row['assistências'], str):
-                        assists_list = [p.strip() for p in row['assistências'].split(";") if p.strip()]
-                        for p in assists_list:
-                            p_nome_original = p
-                            p_limpo = limpar_nome(p)
-                            if p_limpo and p_limpo != 'nan' and not any(limpar_nome(term) in p_limpo for term in TERMOS_IGNORADOS):
-                                player_stats_ano[p_nome_original] = player_stats_ano.get(p_nome_original, {'Gols': 0, 'Assistências': 0})
-                                player_stats_ano[p_nome_original]['Assistências'] += 1
-
-            except Exception as e:
-                st.error(f"⚠️ Erro ao processar a aba '{aba}' para Análise por Ano: {e}")
-
-    if player_stats_ano:
-        ranking_ano_lista = []
-        for player, stats in player_stats_ano.items():
-            total = stats['Gols'] + stats['Assistências']
-            if total > 0:
-                ranking_ano_lista.append({
-                    "Jogador": player,
-                    "Gols": stats['Gols'],
-                    "Assistências": stats['Assistências'],
-                    "Total Participações": total
-                })
-
-        if ranking_ano_lista:
-            ranking_ano_lista = sorted(ranking_ano_lista, key=lambda x: (x['Total Participações'], x['Gols'], x['Assistências']), reverse=True)
-            df_ranking_ano = pd.DataFrame(ranking_ano_lista)
-            df_ranking_ano.insert(0, 'Rank', range(1, len(df_ranking_ano) + 1))
-            st.dataframe(df_ranking_ano, use_container_width=True, hide_index=True)
-        else:
-             st.info(f"Nenhum jogador com participação válida encontrado para Ano: {ano_str} / Competição: {comp_str}.")
-    else:
-        st.info(f"Nenhum dado de participação encontrado para Ano: {ano_str} / Competição: {comp_str}.")
-
-
-# 5 & 6. Listar Gols / Assistências (por jogador)
-elif tipo_analise in ["gols", "assistencias"]:
-    if not jogador_escolhido:
-        st.info("👈 Por favor, digite o nome de um jogador na barra lateral.")
-    else:
-        tipo_evento = "Gols" if tipo_analise == "gols" else "Assistências"
-        coluna_busca = limpar_nome(tipo_evento) # 'gols' ou 'assistências'
-        emoji = "⚽" if tipo_analise == "gols" else "👟"
-        ano_str = str(ano_filtrar) if ano_filtrar else "Todos os Anos"
-
-        st.subheader(f"{emoji} Lista de {tipo_evento} de {jogador_escolhido.title()} ({ano_str})")
-        # ... (resto da lógica como estava antes)
-        resultados_lista = []
-        jogador_limpo = limpar_nome(jogador_escolhido)
-
-        # Itera por TODAS as abas do arquivo Excel carregado
-        todas_as_abas = xls.sheet_names if xls else []
-
-        with st.spinner(f"Buscando {tipo_evento.lower()} de {jogador_escolhido.title()} em todas as competições ({ano_str})..."):
-            for aba in todas_as_abas:
-                try:
-                    df = pd.read_excel(xls, sheet_name=aba)
-                    df.columns = [limpar_nome(col) for col in df.columns]
-
-                    cols_essenciais = [coluna_busca, 'partida', 'campeonato', 'ano']
-                    colunas_faltando = [c for c in cols_essenciais if c not in df.columns]
-                    if colunas_faltando:
-                        st.warning(f"⚠️ Aba '{aba}': Faltando colunas: {', '.join(colunas_faltando)}. Pulando para lista de {tipo_evento}.")
-                        continue
-
-                    if 'ano' not in df.columns:
-                        if ano_filtrar:
-                            continue
-                        else:
-                             df['ano'] = pd.NA
-                    else:
-                        df['ano'] = pd.to_numeric(df['ano'], errors='coerce')
-
-                    df_filtrada_ano = df.copy()
-                    if ano_filtrar:
-                        # Compara com NaN de forma segura
-                        df_filtrada_ano = df_filtrada_ano[df_filtrada_ano['ano'] == ano_filtrar]
-
-                    if df_filtrada_ano.empty:
-                        continue
-
-                    for index, row in df_filtrada_ano.iterrows():
-                        participacoes_texto = row.get(coluna_busca, "")
-                        num_participacoes = verificar_participacao(participacoes_texto, jogador_limpo)
-
-                        if num_participacoes > 0:
-                            try:
-                                ano_valor = int(row['ano']) if pd.notna(row['ano']) else "N/A"
-                            except (ValueError, TypeError):
-                                ano_valor = row.get('ano', 'N/A')
-
-                            campeonato = row.get('campeonato', 'N/A')
-                            partida = row.get('partida', 'N/A')
-                            for _ in range(num_participacoes):
-                                resultados_lista.append(f"{emoji} {ano_valor} - {campeonato} - {partida}")
-
-                except Exception as e:
-                    st.error(f"⚠️ Erro ao processar a aba '{aba}' para listar {tipo_evento}: {e}")
-
-        if resultados_lista:
-            resultados_lista.sort()
-            resultados_formatados = [f"{i+1}. {item}" for i, item in enumerate(resultados_lista)]
-            st.markdown("\n".join(resultados_formatados))
-        elif jogador_escolhido:
-            st.info(f"Nenhum(a) {tipo_evento.lower()} encontrado(a) para '{jogador_escolhido.title()}' no ano {ano_str}.")
-
-# --- Rodapé ---
-st.sidebar.divider()
-st.sidebar.caption("Desenvolvido por Riuler") # Opcional: Adicione seus créditos
-st.caption("Aplicação de análise de dados do Cruzeiro")
+# -*- coding: utf-8 -*- # Adicionado para garantir compatibilidade de caracteres
+
+import streamlit as st
+import pandas as pd
+import os # Importar o módulo os para verificar a existência do arquivo
+import tempfile
+import time
+
+from cruzeiro_acervo import abas_do_acervo, carregar_particoes, listar_particoes, particoes_da_consulta
+from cruzeiro_analises import ANALISES_POR_JOGADOR, abas_da_competicao, avisos_analise, executar_analise
+from cruzeiro_dados import assinatura_apelidos, assinatura_arquivo, carregar_base, estatisticas_caches
+from cruzeiro_diagnostico import (
+    contadores, contar, finalizar_perfil, iniciar_perfil, medir, registrar_tempo, taxa_acertos, tempos_etapas
+)
+from cruzeiro_sql import caminho_banco, carregar_banco, usar_banco
+
+# Medição do rerun inteiro; o cProfile só é ligado quando pedido no painel de diagnóstico
+inicio_rerun = time.perf_counter()
+perfil = iniciar_perfil() if st.session_state.pop("perfilar_proximo_rerun", False) else None
+
+# --- Configurações Iniciais e Constantes ---
+
+# Opção 1: Usar o nome do arquivo (caminho relativo).
+#           NECESSÁRIO para deploy no Streamlit Cloud/GitHub.
+#           O arquivo Excel DEVE estar na mesma pasta do script no repositório.
+ARQUIVO_EXCEL = "Cruzeiro Mineiro.xlsx"
+
+# Opção 2: Usar o caminho absoluto (NÃO USAR PARA DEPLOY)
+# ARQUIVO_EXCEL = r"C:\Caminho\Para\Seu\Arquivo\Local\Cruzeiro Mineiro.xlsx" # MANTENHA COMENTADO PARA DEPLOY
+
+# Opção 3: Acervo com várias planilhas (pasta ou manifesto, ver cruzeiro_acervo.py), analisadas juntas.
+#           Definido por CRUZEIRO_ACERVO; cada consulta carrega só as planilhas da competição/ano escolhidos.
+ACERVO = os.environ.get("CRUZEIRO_ACERVO")
+
+# A carga/normalização das abas fica em cruzeiro_dados.py e as análises em cruzeiro_analises.py
+
+ANALISES_DISPONIVEIS = {
+    "Números Gerais (por jogador)": "numeros_gerais",
+    "Jogos com Participações (por jogador)": "jogos_participacoes",
+    "Ranking Geral (por competição)": "ranking", # Ajustado nome para clareza
+    "Análise por Ano (Ranking)": "analise_por_ano",
+    "Pênaltis e Gols Contra (por competição)": "lances_especiais",
+    "Listar Gols (por jogador)": "gols",
+    "Listar Assistências (por jogador)": "assistencias"
+}
+
+LINHAS_POR_PAGINA = 50 # Listas de jogos/gols/assistências: só a página visível é enviada ao navegador
+
+# --- Funções Auxiliares ---
+
+@st.cache_resource(show_spinner="Lendo a planilha...", max_entries=2) # Cache por (arquivo, mtime, hash, apelidos): só reprocessa se algo mudar
+def carregar_base_em_cache(arquivo, mtime, hash_arquivo, versao_apelidos):
+    """Lê e normaliza as abas uma única vez por versão do arquivo (só as abas alteradas, se o arquivo mudar).
+
+    cache_resource devolve o mesmo objeto a todas as sessões, sem as cópias (pickle) do cache_data:
+    a base é somente leitura (ver cruzeiro_dados.congelar_base) e a memória não cresce com as sessões.
+    """
+    contar("cache_resource: falhas") # Só roda quando a chave não está no cache
+    return carregar_base(arquivo)
+
+def carregar_dados_banco(banco):
+    """Abre o banco SQLite importado da planilha (CRUZEIRO_BACKEND=sqlite); as análises viram consultas SQL."""
+    if not os.path.exists(banco):
+        st.error(f"❌ Erro Fatal: Banco '{banco}' NÃO ENCONTRADO.")
+        st.error(f"Importe a planilha antes: python cruzeiro_sql.py \"{ARQUIVO_EXCEL}\"")
+        return None
+    try:
+        return carregar_banco(banco) # Reaberto só quando o banco muda (nova importação)
+    except Exception as e:
+        st.error(f"❌ Erro ao abrir o banco '{banco}': {e}")
+        return None
+
+def listar_particoes_acervo(acervo):
+    """Partições (planilhas) do acervo, sem carregá-las; None se o acervo não puder ser lido."""
+    try:
+        particoes = listar_particoes(acervo)
+    except Exception as e:
+        st.error(f"❌ Erro ao ler o acervo '{acervo}': {e}")
+        return None
+    if not particoes:
+        st.error(f"❌ Nenhuma planilha encontrada no acervo '{acervo}'.")
+        return None
+    return particoes
+
+def carregar_dados_acervo(particoes, tipo_analise, competicao, ano):
+    """Base só com as planilhas do acervo que a consulta precisa (poda por competição e ano)."""
+    try:
+        return carregar_particoes(particoes_da_consulta(particoes, tipo_analise, competicao, ano), abas_acervo=abas_do_acervo(particoes))
+    except Exception as e:
+        st.error(f"❌ Erro ao carregar as planilhas do acervo: {e}")
+        return None
+
+def carregar_dados_excel(arquivo):
+    """Carrega a base normalizada do Excel (abas, partidas e eventos) usando o cache."""
+    # No ambiente de deploy, st.info/success podem poluir menos
+    # st.info(f"Tentando carregar o recurso do arquivo: {arquivo}")
+    if not os.path.exists(arquivo):
+        # No deploy, talvez seja melhor logar o erro internamente
+        st.error(f"❌ Erro Fatal: Arquivo '{arquivo}' NÃO ENCONTRADO no repositório.")
+        st.error("Certifique-se de que o arquivo Excel foi enviado para o GitHub na mesma pasta que o script Python.")
+        return None # Retorna None se não encontrar
+    try:
+        # A chave do cache muda quando o arquivo (mtime/hash) ou os apelidos mudam, forçando nova leitura
+        mtime, hash_arquivo = assinatura_arquivo(arquivo)
+        contar("cache_resource: chamadas")
+        return carregar_base_em_cache(arquivo, mtime, hash_arquivo, assinatura_apelidos(arquivo))
+    except FileNotFoundError: # Redundante se os.path.exists funcionar, mas seguro ter
+        st.error(f"❌ Erro: Arquivo '{arquivo}' não encontrado (FileNotFoundError).")
+        return None
+    except Exception as e:
+        st.error(f"❌ Erro ao carregar o arquivo Excel '{arquivo}': {e}")
+        st.error("Verifique se o arquivo Excel não está corrompido ou se é um formato válido.")
+        return None
+
+def obter_competicoes(base):
+    """Retorna a lista de nomes das abas (competições) com 'Todas' no início."""
+    if base:
+        return ["Todas"] + list(base["abas"])
+    return ["Todas"] # Retorna 'Todas' mesmo se o arquivo não carregar
+
+def mostrar_diagnostico():
+    """Painel na sidebar com os tempos por etapa, as taxas de acerto dos caches e o cProfile de um rerun."""
+    with st.sidebar.expander("🛠️ Diagnóstico", expanded=True):
+        st.caption("Tempos por etapa (ms), acumulados neste processo")
+        tempos = pd.DataFrame(tempos_etapas())
+        if not tempos.empty:
+            st.dataframe(tempos.round(1), use_container_width=True, hide_index=True)
+
+        contagem = contadores()
+        chamadas = contagem.get("cache_resource: chamadas", 0)
+        falhas = contagem.get("cache_resource: falhas", 0)
+        caches = [{"cache": "st.cache_resource (base)", "acertos": chamadas - falhas, "falhas": falhas}]
+        caches += [{"cache": nome, **valores} for nome, valores in estatisticas_caches().items()]
+        for cache in caches:
+            taxa = taxa_acertos(cache["acertos"], cache["falhas"])
+            cache["taxa"] = "-" if taxa is None else f"{taxa:.0%}"
+        st.caption("Caches")
+        st.dataframe(pd.DataFrame(caches), use_container_width=True, hide_index=True)
+        origens = {nome.removeprefix("base: "): n for nome, n in contagem.items() if nome.startswith("base: ")}
+        if origens:
+            st.caption("Origem das cargas da base: " + ", ".join(f"{origem} {n}" for origem, n in origens.items()))
+
+        st.button("⏱️ Gerar cProfile do próximo rerun", on_click=lambda: st.session_state.update(perfilar_proximo_rerun=True))
+        if "perfil_rerun" in st.session_state:
+            caminho, resumo = st.session_state["perfil_rerun"]
+            with open(caminho, "rb") as f:
+                st.download_button("Baixar .prof", f.read(), file_name=os.path.basename(caminho))
+            st.code(resumo, language=None)
+
+def formatar_ano(ano):
+    """Ano como texto para as listas ('N/A' se ausente)."""
+    return "N/A" if pd.isna(ano) else f"{int(ano)}"
+
+def mostrar_paginado(df, chave, formatar_pagina=None):
+    """Mostra o DataFrame em páginas de LINHAS_POR_PAGINA linhas, com a numeração da lista inteira.
+
+    Só a página escolhida é formatada (formatar_pagina recebe o pedaço) e enviada ao st.dataframe.
+    """
+    total_paginas = -(-len(df) // LINHAS_POR_PAGINA)
+    pagina = 1
+    if total_paginas > 1:
+        pagina = st.number_input(f"Página (de {total_paginas}):", min_value=1, max_value=total_paginas, value=1, step=1, key=chave)
+    inicio = (pagina - 1) * LINHAS_POR_PAGINA
+    pedaco = df.iloc[inicio:inicio + LINHAS_POR_PAGINA]
+    if formatar_pagina is not None:
+        pedaco = formatar_pagina(pedaco)
+    pedaco = pedaco.set_axis(range(inicio + 1, inicio + len(pedaco) + 1)).rename_axis("Nº")
+    st.dataframe(pedaco, use_container_width=True)
+    st.caption(f"Mostrando {inicio + 1}–{inicio + len(pedaco)} de {len(df)}")
+
+# --- Interface do Streamlit (Sidebar para Controles) ---
+def mostrar_interface():
+    """Sidebar, carga dos dados e resultado da análise escolhida; retorna se o painel de diagnóstico foi pedido."""
+    st.set_page_config(page_title="Análise Cruzeiro", page_icon="🦊", layout="wide") # Configura título e layout
+
+    st.sidebar.title("Análise de Dados - Cruzeiro 🦊")
+
+    # Painel de diagnóstico opcional: ?diagnostico=1 na URL ou CRUZEIRO_DIAGNOSTICO=1 no ambiente
+    modo_diagnostico = st.query_params.get("diagnostico") == "1" or os.environ.get("CRUZEIRO_DIAGNOSTICO") == "1"
+    # Tenta carregar a imagem localmente ou de URL (mais seguro para deploy)
+    try:
+        # Se tiver a imagem no repo:
+        # st.sidebar.image("logo_cruzeiro.png", width=100)
+        # Ou usar uma URL pública:
+        st.sidebar.image("https://upload.wikimedia.org/wikipedia/commons/thumb/9/90/Cruzeiro_Esporte_Clube_%28logo%29.svg/1200px-Cruzeiro_Esporte_Clube_%28logo%29.svg.png", width=100)
+    except Exception:
+        st.sidebar.warning("Não foi possível carregar o logo.")
+
+
+    # --- Carregamento dos Dados ---
+    # Com um acervo, aqui só as partições são listadas: a base é montada depois dos filtros de competição e ano
+    particoes = listar_particoes_acervo(ACERVO) if ACERVO else None
+    if ACERVO:
+        base = None
+    elif usar_banco():
+        base = carregar_dados_banco(caminho_banco(ARQUIVO_EXCEL))
+    else:
+        # Chamada da função que usa @st.cache_resource (a planilha só é lida de novo se o arquivo mudar)
+        base = carregar_dados_excel(ARQUIVO_EXCEL)
+
+    # --- VERIFICAÇÃO CRÍTICA ---
+    if base is None and particoes is None:
+        st.warning("⛔ A aplicação não pode continuar sem os dados do Excel.")
+        st.info("Verifique as mensagens de erro acima. O arquivo 'Cruzeiro Mineiro.xlsx' precisa estar no repositório GitHub junto com este script.")
+        st.stop() # Interrompe a execução do script se o arquivo não foi carregado
+
+    # --- Continua com o restante da interface e lógica ---
+    competicoes = obter_competicoes(base) if particoes is None else ["Todas"] + abas_do_acervo(particoes)
+
+    tipo_analise_display = st.sidebar.selectbox(
+        "Escolha o tipo de análise:",
+        options=list(ANALISES_DISPONIVEIS.keys()),
+        key="tipo_analise_select" # Adiciona chave para evitar problemas de estado
+    )
+    tipo_analise = ANALISES_DISPONIVEIS[tipo_analise_display] # Mapeia de volta para a chave interna
+
+    # --- Inputs Condicionais na Sidebar ---
+    ano_escolhido_input = None
+    competicao_escolhida = "Todas" # Default para 'Todas'
+    jogador_escolhido = None
+
+    # Input de Competição
+    if tipo_analise not in ["gols", "assistencias"]:
+         competicao_escolhida = st.sidebar.selectbox(
+            "Selecione a Competição:",
+            options=competicoes,
+            index=0, # Começa com 'Todas' selecionado
+            key="competicao_select"
+        )
+
+    # Input de Ano
+    if tipo_analise in ["analise_por_ano", "lances_especiais", "gols", "assistencias"]:
+        ano_escolhido_input = st.sidebar.text_input("Digite o Ano (ex: 2023, deixe em branco para todos):", key="ano_input")
+
+    # --- Validação e Processamento do Ano ---
+    ano_filtrar = None
+    if ano_escolhido_input:
+        try:
+            ano_filtrar = int(ano_escolhido_input)
+        except ValueError:
+            st.sidebar.warning(f"'{ano_escolhido_input}' não é um ano válido. Mostrando todos os anos.")
+
+    # Acervo: carrega e combina só as planilhas que podem ter dados da competição/ano escolhidos
+    if particoes is not None:
+        base = carregar_dados_acervo(particoes, tipo_analise, competicao_escolhida, ano_filtrar)
+        if base is None:
+            st.stop()
+
+    # Input de Jogador
+    if tipo_analise not in ["ranking", "analise_por_ano", "lances_especiais"]:
+        # Lista pré-calculada na carga; o selectbox permite buscar digitando parte do nome
+        jogador_escolhido = st.sidebar.selectbox(
+            "Busque o Jogador:",
+            options=base["nomes_jogadores"],
+            index=None, # Nenhum jogador selecionado no início
+            placeholder="Digite para buscar...",
+            key="jogador_input"
+        )
+
+    # --- Lógica Principal e Exibição dos Resultados ---
+    st.header(f"📊 Resultados: {tipo_analise_display}")
+
+    # Determina as abas a serem analisadas (as listas de gols/assistências sempre usam todas)
+    abas_para_analisar = abas_da_competicao(base, competicao_escolhida)
+    if competicao_escolhida and competicao_escolhida != "Todas" and not abas_para_analisar:
+        # Isso não deve acontecer se 'competicoes' foi gerado corretamente
+        st.warning(f"Competição '{competicao_escolhida}' selecionada mas não encontrada.")
+
+
+    # --- Execução da Análise Escolhida ---
+
+    # Adiciona uma verificação se há abas para analisar
+    if not abas_para_analisar and competicao_escolhida != "Todas":
+         st.warning(f"Nenhuma aba encontrada para a competição '{competicao_escolhida}'.")
+         # st.stop() # Decide se quer parar ou continuar (pode não exibir nada)
+    elif not abas_para_analisar and competicao_escolhida == "Todas":
+         st.warning("Nenhuma aba/competição encontrada no arquivo Excel.")
+         st.stop()
+
+    # As análises por jogador só rodam com um jogador escolhido
+    analise_pronta = bool(jogador_escolhido) or tipo_analise not in ANALISES_POR_JOGADOR
+    if analise_pronta:
+        # Abas puladas por falta de colunas
+        for aviso in avisos_analise(base, tipo_analise, competicao_escolhida, ano_filtrar):
+            st.warning(aviso)
+
+    if not analise_pronta:
+        st.info("👈 Por favor, selecione um jogador na barra lateral.")
+
+    # 1. Números Gerais (por jogador)
+    elif tipo_analise == "numeros_gerais":
+        st.subheader(f"Números Gerais de {jogador_escolhido.title()}")
+        with st.spinner(f"Analisando dados de {jogador_escolhido.title()}..."): # Feedback visual
+            df_resultados = executar_analise(base, tipo_analise, jogador=jogador_escolhido, competicao=competicao_escolhida)
+
+        with medir(f"render: {tipo_analise}"): # Inclui a serialização do Styler pelo st.dataframe
+            if not df_resultados.empty:
+                st.dataframe(
+                    df_resultados.style.format({
+                        "Ano": lambda x: "" if pd.isna(x) or x == "Total" or x == "" else f"{x:.0f}", # Formata ano
+                        "Gols": "{:.0f}",
+                        "Assistências": "{:.0f}"
+                     }).apply(lambda x: ['background-color: #eee; font-weight: bold;' if x.name == len(df_resultados)-1 else '' for i in x], axis=1 # Destaca Total Geral
+                     ).apply(lambda x: ['font-weight: bold;' if x.Ano == "Total" else '' for i in x], axis=1), # Negrito nos Totais de Competição
+                     use_container_width=True,
+                     hide_index=True # Esconde o índice numérico padrão
+                )
+            else:
+                st.info(f"Nenhuma participação em gols ou assistências encontrada para '{jogador_escolhido.title()}' nos filtros selecionados.")
+
+    # 2. Jogos com Participações (por jogador)
+    elif tipo_analise == "jogos_participacoes":
+        st.subheader(f"Jogos com Participação em Gols/Assistências de {jogador_escolhido.title()}")
+        with st.spinner(f"Buscando jogos de {jogador_escolhido.title()}..."):
+            df_jogos = executar_analise(base, tipo_analise, jogador=jogador_escolhido, competicao=competicao_escolhida)
+
+        with medir(f"render: {tipo_analise}"):
+            if not df_jogos.empty:
+                # Lista em ordem cronológica, paginada
+                mostrar_paginado(
+                    df_jogos,
+                    chave=f"pagina_{tipo_analise}_{jogador_escolhido}_{competicao_escolhida}",
+                    formatar_pagina=lambda pagina: pagina.assign(
+                        Ano=pagina["Ano"].map(formatar_ano),
+                        Tipo=pagina["Tipo"].map({"Gol": "⚽ Gol", "Assistência": "👟 Assistência"})
+                    )
+                )
+            else:
+                st.info(f"Nenhuma participação encontrada para '{jogador_escolhido.title()}' nos filtros selecionados.")
+
+    # 3. Ranking Geral (por competição)
+    elif tipo_analise == "ranking":
+        comp_selecionada = competicao_escolhida if competicao_escolhida else "Todas" # Deveria ser 'Todas' ou uma competição
+        st.subheader(f"Ranking de Participações - Competição: {comp_selecionada}")
+        with st.spinner(f"Calculando ranking para {comp_selecionada}..."):
+            df_ranking = executar_analise(base, tipo_analise, competicao=competicao_escolhida)
+
+        with medir(f"render: {tipo_analise}"):
+            if not df_ranking.empty:
+                st.dataframe(df_ranking, use_container_width=True, hide_index=True)
+            else:
+                st.info(f"Nenhum dado de participação encontrado para a competição '{comp_selecionada}'.")
+
+    # 4. Análise por Ano (Ranking)
+    elif tipo_analise == "analise_por_ano":
+        ano_str = str(ano_filtrar) if ano_filtrar else "Todos os Anos"
+        comp_str = competicao_escolhida if competicao_escolhida and competicao_escolhida != "Todas" else "Todas Competições"
+        st.subheader(f"Ranking de Participações - Ano: {ano_str} / Competição: {comp_str}")
+        with st.spinner(f"Calculando ranking para Ano: {ano_str} / Competição: {comp_str}..."):
+            df_ranking_ano = executar_analise(base, tipo_analise, competicao=competicao_escolhida, ano=ano_filtrar)
+
+        with medir(f"render: {tipo_analise}"):
+            if not df_ranking_ano.empty:
+                st.dataframe(df_ranking_ano, use_container_width=True, hide_index=True)
+            else:
+                st.info(f"Nenhum dado de participação encontrado para Ano: {ano_str} / Competição: {comp_str}.")
+
+    # 5. Pênaltis e Gols Contra (por competição)
+    elif tipo_analise == "lances_especiais":
+        ano_str = str(ano_filtrar) if ano_filtrar else "Todos os Anos"
+        comp_str = competicao_escolhida if competicao_escolhida and competicao_escolhida != "Todas" else "Todas Competições"
+        st.subheader(f"Pênaltis, Gols Contra e Lances Especiais - Ano: {ano_str} / Competição: {comp_str}")
+        df_lances = executar_analise(base, tipo_analise, competicao=competicao_escolhida, ano=ano_filtrar)
+
+        with medir(f"render: {tipo_analise}"): # Inclui a serialização do Styler pelo st.dataframe
+            if not df_lances.empty:
+                st.dataframe(
+                    df_lances.style.apply(lambda x: ['font-weight: bold;' if x.Competição == "Total" else '' for i in x], axis=1), # Negrito no Total
+                    use_container_width=True,
+                    hide_index=True
+                )
+            else:
+                st.info(f"Nenhum pênalti, gol contra ou lance especial encontrado para Ano: {ano_str} / Competição: {comp_str}.")
+
+    # 6 & 7. Listar Gols / Assistências (por jogador)
+    elif tipo_analise in ["gols", "assistencias"]:
+        tipo_evento = "Gols" if tipo_analise == "gols" else "Assistências"
+        emoji = "⚽" if tipo_analise == "gols" else "👟"
+        ano_str = str(ano_filtrar) if ano_filtrar else "Todos os Anos"
+
+        st.subheader(f"{emoji} Lista de {tipo_evento} de {jogador_escolhido.title()} ({ano_str})")
+        with st.spinner(f"Buscando {tipo_evento.lower()} de {jogador_escolhido.title()} em todas as competições ({ano_str})..."):
+            df_lista = executar_analise(base, tipo_analise, jogador=jogador_escolhido, ano=ano_filtrar)
+
+        with medir(f"render: {tipo_analise}"):
+            if not df_lista.empty:
+                # Lista em ordem cronológica, paginada (o tipo já está no título)
+                mostrar_paginado(
+                    df_lista.drop(columns="Tipo"),
+                    chave=f"pagina_{tipo_analise}_{jogador_escolhido}_{ano_filtrar}",
+                    formatar_pagina=lambda pagina: pagina.assign(Ano=pagina["Ano"].map(formatar_ano))
+                )
+            else:
+                st.info(f"Nenhum(a) {tipo_evento.lower()} encontrado(a) para '{jogador_escolhido.title()}' no ano {ano_str}.")
+
+    return modo_diagnostico
+
+try:
+    modo_diagnostico = mostrar_interface()
+finally:
+    # Também quando o rerun é interrompido (st.stop) ou falha: um cProfile deixado ligado impediria o das outras sessões
+    registrar_tempo("rerun", time.perf_counter() - inicio_rerun)
+    if perfil is not None:
+        caminho_perfil = os.path.join(tempfile.gettempdir(), f"cruzeiro_rerun_{time.strftime('%Y%m%d_%H%M%S')}.prof")
+        st.session_state["perfil_rerun"] = (caminho_perfil, finalizar_perfil(perfil, caminho_perfil))
+
+# --- Diagnóstico ---
+if modo_diagnostico:
+    mostrar_diagnostico()
+
+# --- Rodapé ---
+st.sidebar.divider()
+st.sidebar.caption("Desenvolvido por Riuler") # Opcional: Adicione seus créditos
+st.caption("Aplicação de análise de dados do Cruzeiro")
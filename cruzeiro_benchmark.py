@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+"""Benchmark das análises sobre planilhas sintéticas no formato de 'Cruzeiro Mineiro.xlsx'.
+
+Uso:
+    python cruzeiro_benchmark.py --escalas 10 100 --saida benchmark.json
+"""
+
+import argparse
+import itertools
+import json
+import os
+import platform
+import random
+import statistics
+import tempfile
+import time
+
+import pandas as pd
+from openpyxl import Workbook
+
+import cruzeiro_dados
+from cruzeiro_analises import ANALISES, executar_analise
+from cruzeiro_dados import calcular_ranking
+
+# --- Planilha sintética ---
+
+# Abas da planilha real com a quantidade aproximada de partidas (escala 1)
+ABAS_REFERENCIA = {
+    "Mineiro": 820, "Copa dos Campeões": 13, "Libertadores": 166, "Copa do Brasil": 183,
+    "Copa Sul-Americana": 34, "Brasileiro": 1183, "Primeira Liga": 8, "Serie B": 114,
+    "Copa Mercosul": 35, "Sul-Minas": 39, "Supercopa": 60, "Seletiva Libertadores": 8,
+    "Recopa Sul-Americana": 3, "Mundial de Clubes": 3,
+}
+
+PRIMEIROS_NOMES = ["Alex", "Fred", "Marcelo", "Fábio", "Dirceu", "Tostão", "Ricardinho", "Wagner",
+                   "Thiago", "Lucas", "Arthur", "Matheus", "Éverton", "Roni", "Joãozinho", "Sorín"]
+SOBRENOMES = ["", "Ramos", "Silva", "Lopes", "Neves", "Pereira", "Gomes", "Santos", "Jr", "Moreno",
+              "Souza", "Oliveira", "Batata", "Júnior", "Costa", "Alves"]
+ADVERSARIOS = ["Atlético", "América", "Flamengo", "Palmeiras", "Grêmio", "Inter", "Vasco", "Santos",
+               "São Paulo", "Corinthians", "Botafogo", "Fluminense", "Bahia", "Sport", "Boca", "River"]
+
+def gerar_planilha(caminho, escala=1, semente=0):
+    """Gera uma planilha sintética com as mesmas colunas e abas da real, escala vezes maior.
+
+    Cada aba tem 'Ano', 'Jogo', 'Campeonato', 'Partida', 'Gols' e 'Assistências', com nomes
+    separados por ';' (às vezes com espaços extras) e alguns TERMOS_IGNORADOS misturados.
+    Retorna a quantidade total de partidas geradas.
+    """
+    aleatorio = random.Random(semente)
+    # Elenco cresce com a escala, mas menos que as partidas (carreiras ficam mais longas)
+    jogadores = sorted({f"{p} {s}".strip() for p in PRIMEIROS_NOMES for s in SOBRENOMES})
+    jogadores += [f"Jogador {i}" for i in range(int(1500 * max(1, escala) ** 0.5))]
+    # Poucos artilheiros, muitos coadjuvantes. Os pesos vão acumulados para o choices: com weights, ele
+    # refaz a soma a cada sorteio (O(jogadores)), o que inviabiliza as escalas maiores
+    pesos = list(itertools.accumulate(1 / (i + 1) for i in range(len(jogadores))))
+    pesos_gols = list(itertools.accumulate([25, 30, 22, 12, 6, 3, 2]))
+
+    wb = Workbook(write_only=True) # Escrita em fluxo: a planilha inteira não fica em memória
+    total = 0
+    for aba, partidas_aba in ABAS_REFERENCIA.items():
+        ws = wb.create_sheet(aba)
+        ws.append(["Ano", "Jogo", "Campeonato", "Partida", "Gols", "Assistências"])
+        partidas_aba = max(1, int(partidas_aba * escala))
+        ano_inicial = 1921 if aba == "Mineiro" else 1960
+        for jogo in range(1, partidas_aba + 1):
+            ano = ano_inicial + (jogo * (2026 - ano_inicial)) // partidas_aba
+            gols_cruzeiro = aleatorio.choices(range(7), cum_weights=pesos_gols)[0]
+            adversario = aleatorio.choice(ADVERSARIOS)
+            partida = f"Cruzeiro {gols_cruzeiro}x{aleatorio.randint(0, 3)} {adversario}"
+
+            gols, assistencias = [], []
+            for _ in range(gols_cruzeiro):
+                autor = aleatorio.choices(jogadores, cum_weights=pesos)[0]
+                gols.append("Gol contra" if aleatorio.random() < 0.03 else autor)
+                sorteio = aleatorio.random()
+                if sorteio < 0.08:
+                    assistencias.append("Penalti")
+                elif sorteio < 0.2:
+                    assistencias.append("Sem ass")
+                elif sorteio < 0.25:
+                    assistencias.append("Falta")
+                else:
+                    assistencias.append(aleatorio.choices(jogadores, cum_weights=pesos)[0])
+            separador = "; " if aleatorio.random() < 0.1 else ";" # Espaços extras, como na planilha real
+            ws.append([
+                ano, jogo, aba, partida,
+                separador.join(gols) or None, separador.join(assistencias) or None,
+            ])
+        total += partidas_aba
+    wb.save(caminho)
+    return total
+
+# --- Medição ---
+
+def medir(funcao, repeticoes=1):
+    """Executa funcao repetidas vezes e devolve (tempos em segundos, último resultado)."""
+    tempos = []
+    resultado = None
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        resultado = funcao()
+        tempos.append(time.perf_counter() - inicio)
+    return tempos, resultado
+
+def analises_benchmark(base, jogador, ano):
+    """As sete análises do app sobre a base carregada (nome -> função sem argumentos)."""
+    return {
+        analise: (lambda analise=analise: executar_analise(base, analise, jogador=jogador, ano=ano))
+        for analise in ANALISES
+    }
+
+def executar_benchmark(escala, pasta, repeticoes=5, workers=None):
+    """Gera a planilha na escala pedida e mede carga e análises nos caminhos frio e quente.
+
+    'frio' é a primeira chamada logo após a carga; 'quente' é a mediana das repetições seguintes.
+    O custo total de uma primeira consulta sem snapshot é carga.excel + frio; carga.excel_um_ano é
+    a leitura do Excel só com as partidas do ano da consulta (quase o mesmo tempo: o filtro poupa
+    memória, mas toda linha ainda é lida).
+    """
+    caminho = os.path.join(pasta, f"sintetica_x{escala:g}.xlsx")
+    inicio = time.perf_counter()
+    partidas = gerar_planilha(caminho, escala)
+    tempo_geracao = time.perf_counter() - inicio
+
+    mtime, hash_arquivo = cruzeiro_dados.assinatura_arquivo(caminho)
+    (tempo_excel,), base = medir(lambda: cruzeiro_dados.ler_planilha(caminho, workers))
+    (tempo_gravacao,), _ = medir(lambda: cruzeiro_dados.salvar_snapshot(base, caminho, mtime, hash_arquivo))
+    (tempo_snapshot,), base = medir(lambda: cruzeiro_dados.carregar_snapshot(caminho, mtime, hash_arquivo))
+
+    jogador = calcular_ranking(base["cubo"], base["nomes_por_jogador"])["Jogador"].iloc[0] # O pior caso: a carreira mais longa
+    ano = int(base["eventos"]["ano"].median())
+    (tempo_excel_ano,), _ = medir(lambda: cruzeiro_dados.ler_planilha(caminho, workers, anos=[ano])) # Leitura em fluxo filtrada
+
+    analises = {}
+    for nome, funcao in analises_benchmark(base, jogador, ano).items():
+        (frio,), _ = medir(funcao)
+        quentes, _ = medir(funcao, repeticoes)
+        analises[nome] = {"frio": frio, "quente": statistics.median(quentes), "quente_min": min(quentes)}
+
+    return {
+        "escala": escala,
+        "partidas": partidas,
+        "eventos": len(base["eventos"]),
+        "jogadores": len(base["indice_jogadores"]),
+        "tamanho_arquivo": os.path.getsize(caminho),
+        "memoria": cruzeiro_dados.memoria_base(base),
+        "geracao": tempo_geracao,
+        "carga": {"excel": tempo_excel, "excel_um_ano": tempo_excel_ano, "snapshot_gravacao": tempo_gravacao, "snapshot_leitura": tempo_snapshot},
+        "consulta": {"jogador": jogador, "ano": ano},
+        "analises": analises,
+    }
+
+def main(argv=None):
+    """CLI: roda o benchmark nas escalas pedidas e grava/imprime o resultado em JSON."""
+    parser = argparse.ArgumentParser(description="Benchmark das análises com planilhas sintéticas.")
+    parser.add_argument("--escalas", type=float, nargs="+", default=[10], help="Multiplicadores do tamanho da planilha real (padrão: 10)")
+    parser.add_argument("--repeticoes", type=int, default=5, help="Repetições no caminho quente (padrão: %(default)s)")
+    parser.add_argument("--workers", type=int, default=None, help="Processos para ler as abas (padrão: CRUZEIRO_WORKERS ou 1)")
+    parser.add_argument("--pasta", default=None, help="Onde gerar as planilhas (padrão: pasta temporária)")
+    parser.add_argument("--saida", default=None, help="Arquivo JSON de saída (padrão: só imprime)")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as pasta_temporaria:
+        pasta = args.pasta or pasta_temporaria
+        os.makedirs(pasta, exist_ok=True)
+        resultados = {
+            "ambiente": {"python": platform.python_version(), "pandas": pd.__version__, "plataforma": platform.platform()},
+            "resultados": [executar_benchmark(escala, pasta, args.repeticoes, args.workers) for escala in args.escalas],
+        }
+
+    texto = json.dumps(resultados, ensure_ascii=False, indent=2)
+    if args.saida:
+        with open(args.saida, "w", encoding="utf-8") as f:
+            f.write(texto)
+    print(texto)
+
+if __name__ == "__main__":
+    main()
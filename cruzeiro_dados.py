@@ -0,0 +1,910 @@
+# -*- coding: utf-8 -*-
+"""Carregamento e normalização da planilha do Cruzeiro (sem dependência do Streamlit)."""
+
+import argparse
+import csv
+import functools
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+import unicodedata
+import zipfile
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+from types import MappingProxyType
+from xml.etree import ElementTree
+
+import pandas as pd
+from openpyxl import load_workbook
+from openpyxl.cell.cell import ERROR_CODES
+
+from cruzeiro_diagnostico import contar, cronometrado, medir, registrar_tempo
+
+# --- Constantes ---
+
+# Termos que não são jogadores, por classe do lance (coluna 'classe' dos eventos). A comparação é
+# por trecho do nome, sem acentos e maiúsculas (ver canonizar_nome); para ignorar outro termo, basta
+# incluí-lo na classe certa (ou em uma classe nova)
+CLASSES_TERMOS = {
+    "penalti": ["Penalti"],
+    "sem_ass": ["Sem ass"],
+    "falta": ["Falta"],
+    "gol_contra": ["Gol contra"],
+}
+TERMOS_IGNORADOS = [termo for termos in CLASSES_TERMOS.values() for termo in termos]
+
+# Colunas usadas pelas análises; o resto da aba (Jogo, Obs., colunas sem nome...) é descartado na carga
+COLUNAS_ESSENCIAIS = ["partida", "campeonato", "ano", "gols", "assistências"]
+COLUNAS_PARTICIPACAO = ["gols", "assistências"] # Colunas com listas de nomes separados por ';'
+
+# Colunas de texto repetidas em eventos, cubo e partidas, guardadas como Categorical (códigos
+# inteiros + dicionário de nomes): filtros e agrupamentos comparam códigos, não textos
+COLUNAS_CATEGORICAS = ["aba", "campeonato", "partida", "tipo", "jogador", "jogador_limpo", "classe"]
+
+# Grafias guardadas nas memoizações de nomes (canonizar_nome, classificar_nome). Cobre com folga os nomes de uma
+# planilha grande; o limite evita que nomes digitados nas consultas (ex.: ?jogador= na API) se acumulem
+TAMANHO_CACHE_NOMES = 2 ** 16
+
+# CSV opcional com colunas 'apelido' e 'jogador', ao lado da planilha (ou no caminho da variável CRUZEIRO_APELIDOS)
+ARQUIVO_APELIDOS = "apelidos.csv"
+
+TAMANHO_BLOCO = 5000 # Partidas por bloco na leitura em fluxo das abas (ver ler_aba_em_blocos)
+
+# Textos que o pd.read_excel lê como células vazias (os na_values padrão do pandas) e códigos de
+# erro do Excel; a leitura em fluxo trata as células da mesma forma (ver _valor_celula)
+TEXTOS_VAZIOS = frozenset([
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND", "1.#QNAN",
+    "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null",
+]) | frozenset(ERROR_CODES)
+
+VERSAO_SNAPSHOT = 4 # Incrementar quando o formato do snapshot colunar mudar
+
+# Namespaces do .xlsx e itens da tabela de textos compartilhados (usados na recarga incremental)
+_NS_PLANILHA = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+_NS_RELACOES = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_ITEM_TEXTO = re.compile(rb"<(?:\w+:)?si\b(?:[^>]*/>|.*?</(?:\w+:)?si>)", re.DOTALL)
+
+# Última base carregada por arquivo neste processo, ponto de partida da recarga incremental
+_BASES_CARREGADAS = {}
+_TRAVA_CARGA = threading.Lock() # Uma carga por vez: chamadas simultâneas esperam a primeira e a reaproveitam
+
+# Memoização do hash do arquivo por (caminho, mtime, tamanho) para não reler o arquivo a cada rerun
+_HASHES_ARQUIVO = {}
+
+# --- Funções Auxiliares ---
+
+def limpar_nome(nome):
+    """Remove espaços extras e converte para minúsculas para comparação."""
+    return str(nome).strip().lower()
+
+@functools.lru_cache(maxsize=TAMANHO_CACHE_NOMES)
+def canonizar_nome(nome):
+    """Forma canônica do nome para comparação: sem acentos, com espaços colapsados e em minúsculas.
+
+    Ex.: '  Éverton   Ribeiro' -> 'everton ribeiro'. Memoizada (até TAMANHO_CACHE_NOMES grafias, as
+    mais recentes): cada grafia é normalizada uma vez por carga.
+    """
+    texto = unicodedata.normalize("NFKD", str(nome))
+    texto = "".join(c for c in texto if not unicodedata.combining(c))
+    return " ".join(texto.split()).casefold()
+
+def id_jogador(nome, apelidos=None):
+    """Id canônico do jogador: o nome canonizado ou, se for um apelido, o id do jogador correspondente."""
+    nome_canonico = canonizar_nome(nome)
+    return apelidos.get(nome_canonico, nome_canonico) if apelidos else nome_canonico
+
+def ids_jogadores(nomes, apelidos=None):
+    """Id canônico de cada nome da série (ver id_jogador), calculado uma vez por grafia distinta."""
+    if isinstance(nomes.dtype, pd.CategoricalDtype):
+        return nomes.map({grafia: id_jogador(grafia, apelidos) for grafia in nomes.cat.categories})
+    ids = nomes.map({grafia: id_jogador(grafia, apelidos) for grafia in pd.unique(nomes.dropna())})
+    return ids.astype(nomes.dtype) # Mantém o tipo texto mesmo com a série vazia
+
+def compilar_classificador(classes_termos):
+    """Regex única para todos os termos, com um grupo nomeado por classe (None se não houver termos)."""
+    grupos = [
+        f"(?P<{classe}>{'|'.join(re.escape(canonizar_nome(termo)) for termo in termos)})"
+        for classe, termos in classes_termos.items() if termos
+    ]
+    return re.compile("|".join(grupos)) if grupos else None
+
+_CLASSIFICADOR = compilar_classificador(CLASSES_TERMOS)
+
+@functools.lru_cache(maxsize=TAMANHO_CACHE_NOMES)
+def classificar_nome(nome_limpo):
+    """Classe do lance para o nome (já canonizado): '' para jogadores ou a classe do primeiro termo ignorado no nome.
+
+    Memoizada até TAMANHO_CACHE_NOMES nomes: também recebe nomes das consultas (ver tem_termo_ignorado).
+    """
+    achado = _CLASSIFICADOR.search(nome_limpo) if _CLASSIFICADOR else None
+    return achado.lastgroup if achado else ""
+
+def classes_nomes(nomes_limpos):
+    """Classe (ver classificar_nome) de cada nome da série, calculada uma vez por nome distinto."""
+    if isinstance(nomes_limpos.dtype, pd.CategoricalDtype):
+        return nomes_limpos.map({nome: classificar_nome(nome) for nome in nomes_limpos.cat.categories})
+    classes = nomes_limpos.map({nome: classificar_nome(nome) for nome in pd.unique(nomes_limpos.dropna())})
+    return classes.astype(object) # Mantém o tipo texto mesmo com a série vazia
+
+def tem_termo_ignorado(nome_limpo):
+    """Indica se o nome (já canonizado) contém algum dos TERMOS_IGNORADOS."""
+    return classificar_nome(nome_limpo) != ""
+
+def separar_nomes(serie):
+    """Separa as listas ';' de uma coluna em um nome por linha, mantendo o índice da linha de origem.
+
+    Células que não são texto são ignoradas; nomes vêm sem espaços nas pontas e nunca vazios.
+    """
+    nomes = serie[serie.map(lambda x: isinstance(x, str))].astype(str).str.split(";").explode().str.strip()
+    return nomes[nomes != ""]
+
+def mascara_eventos_validos(eventos):
+    """Eventos que contam como participação de um jogador: sem classe de lance (ver classificar_nome) e com nome."""
+    return (eventos["classe"] == "") & (eventos["jogador_limpo"] != "nan")
+
+def compactar_tabela(df):
+    """Converte as COLUNAS_CATEGORICAS presentes em Categorical, com as categorias em ordem alfabética.
+
+    A ordem alfabética mantém os agrupamentos ordenados (sort=True) iguais aos feitos sobre os
+    textos. Colunas que já são categóricas (ex.: lidas do snapshot ou agrupadas a partir dos
+    eventos) ficam só com as categorias usadas, reordenadas: o resultado não depende da origem.
+    """
+    colunas = {}
+    for coluna in COLUNAS_CATEGORICAS:
+        if coluna not in df.columns:
+            continue
+        serie = df[coluna]
+        if isinstance(serie.dtype, pd.CategoricalDtype):
+            serie = serie.cat.remove_unused_categories()
+            colunas[coluna] = serie.cat.reorder_categories(serie.cat.categories.sort_values())
+        else:
+            colunas[coluna] = serie.astype("category")
+    return df.assign(**colunas) if colunas else df
+
+def memoria_base(base):
+    """Memória ocupada pelas tabelas da base, em bytes (incluindo os textos): eventos, cubo e partidas."""
+    return {
+        "eventos": int(base["eventos"].memory_usage(deep=True).sum()),
+        "cubo": int(base["cubo"].memory_usage(deep=True).sum()),
+        "partidas": int(sum(df.memory_usage(deep=True).sum() for df in base["partidas"].values())),
+    }
+
+def construir_cubo(eventos):
+    """Agregado pré-calculado de participações válidas por (jogador, aba, campeonato, ano).
+
+    Cada linha traz as contagens de 'gols' e 'assistências' da combinação; anos e campeonatos
+    ausentes viram grupos próprios (NaN). As linhas seguem a ordem de primeira aparição na
+    planilha, o que mantém os desempates dos rankings iguais aos da contagem evento a evento.
+    """
+    validos = eventos[mascara_eventos_validos(eventos)]
+    return (
+        validos[["jogador", "jogador_limpo", "aba", "campeonato", "ano"]]
+        .assign(gols=validos["tipo"] == "gols", assistências=validos["tipo"] == "assistências")
+        .groupby(["jogador", "jogador_limpo", "aba", "campeonato", "ano"], sort=False, dropna=False, observed=True)[["gols", "assistências"]]
+        .sum()
+        .reset_index()
+    )
+
+def calcular_ranking(cubo, nomes, abas=None, ano=None):
+    """Ranking de participações (gols + assistências) consolidado a partir do cubo.
+
+    Filtra o cubo pelas abas e/ou ano informados e soma por id do jogador, juntando grafias e
+    apelidos; nomes é o {id: nome de exibição} da base (ver nomes_por_jogador). Retorna as colunas
+    Rank, Jogador, Gols, Assistências e Total Participações, ordenadas por total, gols e
+    assistências (empates na ordem de aparição na planilha).
+    """
+    filtro = pd.Series(True, index=cubo.index)
+    if abas is not None:
+        filtro &= cubo["aba"].isin(abas)
+    if ano:
+        filtro &= cubo["ano"] == ano
+
+    somas = cubo[filtro].groupby("jogador_limpo", sort=False, observed=True)[["gols", "assistências"]].sum().reset_index()
+    return ordenar_ranking(somas, nomes)
+
+def ordenar_ranking(somas, nomes):
+    """Ranking a partir das somas por id (colunas jogador_limpo, gols e assistências, na ordem de desempate).
+
+    Usado por calcular_ranking e pelas consultas SQL (ver cruzeiro_sql), para os dois darem a mesma tabela
+    (inclusive vazia: sem linhas, o SQLite devolve as somas como object).
+    """
+    ranking = somas.astype({"gols": "int64", "assistências": "int64"}).rename(columns={"gols": "Gols", "assistências": "Assistências"})
+    ranking.insert(0, "Jogador", [nomes.get(id_, id_) for id_ in ranking.pop("jogador_limpo")])
+    ranking["Total Participações"] = ranking["Gols"] + ranking["Assistências"]
+    ranking = ranking.sort_values(["Total Participações", "Gols", "Assistências"], ascending=False, kind="stable", ignore_index=True)
+    ranking.insert(0, "Rank", range(1, len(ranking) + 1))
+    return ranking
+
+def construir_indice_jogadores(tabela):
+    """Índice invertido: jogador_limpo -> posições (iloc) das suas linhas na tabela (eventos ou cubo)."""
+    return {nome: posicoes for nome, posicoes in tabela.groupby("jogador_limpo", sort=False, observed=True).indices.items()}
+
+def nomes_por_jogador(eventos):
+    """Nome de exibição de cada jogador válido (sem termos ignorados): {id: grafia mais comum na planilha}."""
+    validos = eventos[mascara_eventos_validos(eventos)]
+    grafias = validos.groupby(["jogador_limpo", "jogador"], sort=False, observed=True).size().reset_index(name="n")
+    grafias = grafias.sort_values("n", ascending=False, kind="stable").drop_duplicates("jogador_limpo")
+    return dict(zip(grafias["jogador_limpo"], grafias["jogador"]))
+
+def listar_nomes_jogadores(nomes):
+    """Lista de nomes para a busca, em ordem alfabética sem acentos (nomes: ver nomes_por_jogador)."""
+    return sorted(nomes.values(), key=canonizar_nome)
+
+def eventos_do_jogador(base, jogador_limpo):
+    """Eventos válidos do jogador (pelo id) via índice, sem varrer a tabela inteira (vazio se for termo ignorado)."""
+    posicoes = base["indice_jogadores"].get(jogador_limpo)
+    if posicoes is None or tem_termo_ignorado(jogador_limpo):
+        return base["eventos"].iloc[0:0]
+    return base["eventos"].iloc[posicoes]
+
+def assinatura_arquivo(arquivo):
+    """Retorna (mtime, hash sha256) do arquivo, usados como chave do cache dos dados."""
+    stat = os.stat(arquivo)
+    chave = (os.path.abspath(arquivo), stat.st_mtime_ns, stat.st_size)
+    if chave not in _HASHES_ARQUIVO:
+        contar("hash do arquivo: calculado")
+        sha = hashlib.sha256()
+        with open(arquivo, "rb") as f:
+            for bloco in iter(lambda: f.read(1 << 20), b""):
+                sha.update(bloco)
+        _HASHES_ARQUIVO[chave] = sha.hexdigest()
+    return stat.st_mtime_ns, _HASHES_ARQUIVO[chave]
+
+def caminho_apelidos(arquivo):
+    """Arquivo de apelidos da planilha: CRUZEIRO_APELIDOS ou ARQUIVO_APELIDOS na pasta da planilha."""
+    return os.environ.get("CRUZEIRO_APELIDOS") or os.path.join(os.path.dirname(os.path.abspath(arquivo)), ARQUIVO_APELIDOS)
+
+def assinatura_apelidos(arquivo):
+    """(mtime, tamanho) do arquivo de apelidos, ou None se ele não existir; entra na chave dos caches."""
+    try:
+        stat = os.stat(caminho_apelidos(arquivo))
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+def carregar_apelidos(arquivo):
+    """Lê o CSV de apelidos da planilha como {nome canonizado do apelido: id do jogador}.
+
+    O CSV tem as colunas 'apelido' e 'jogador' (ex.: 'Jussie,Jussiê'); os dois lados passam por
+    canonizar_nome. Cadeias (A -> B -> C) são resolvidas até o fim e ciclos são ignorados.
+    Sem arquivo, retorna {}.
+    """
+    caminho = caminho_apelidos(arquivo)
+    if not os.path.exists(caminho):
+        return {}
+    with open(caminho, encoding="utf-8-sig", newline="") as f:
+        leitor = csv.DictReader(f)
+        if not {"apelido", "jogador"} <= set(leitor.fieldnames or []):
+            raise ValueError(f"Arquivo de apelidos '{caminho}' precisa das colunas 'apelido' e 'jogador'.")
+        pares = {
+            canonizar_nome(linha["apelido"]): canonizar_nome(linha["jogador"])
+            for linha in leitor if (linha["apelido"] or "").strip() and (linha["jogador"] or "").strip()
+        }
+
+    apelidos = {}
+    for apelido, destino in pares.items():
+        vistos = {apelido}
+        while destino in pares and destino not in vistos:
+            vistos.add(destino)
+            destino = pares[destino]
+        if destino != apelido:
+            apelidos[apelido] = destino
+    return apelidos
+
+# --- Normalização ---
+
+def normalizar_aba(df):
+    """Limpa os nomes das colunas e mantém só as colunas essenciais presentes na aba.
+
+    'ano' vira numérico (inválidos viram NaN), 'partida'/'campeonato' viram texto e células
+    de gols/assistências que não são texto viram NaN, como já eram ignoradas pelas análises.
+    """
+    df = df.copy()
+    df.columns = [limpar_nome(col) for col in df.columns]
+    df = df.loc[:, ~df.columns.duplicated()] # Mantém a primeira ocorrência de colunas repetidas
+    df = df[[c for c in COLUNAS_ESSENCIAIS if c in df.columns]]
+    if "ano" in df.columns:
+        df["ano"] = pd.to_numeric(df["ano"], errors="coerce")
+    for coluna in ["partida", "campeonato"]:
+        if coluna in df.columns:
+            df[coluna] = df[coluna].map(lambda x: x if pd.isna(x) else str(x)) # Tipos uniformes (exigido pelo Arrow)
+    for coluna in COLUNAS_PARTICIPACAO:
+        if coluna in df.columns:
+            df[coluna] = df[coluna].where(df[coluna].map(lambda x: isinstance(x, str)))
+    return df
+
+def explodir_eventos(df, aba):
+    """Transforma as listas de gols/assistências de uma aba em uma linha por evento.
+
+    Colunas: aba, linha, campeonato, ano, partida, tipo ('gols' ou 'assistências'),
+    jogador (nome como escrito, sem espaços nas pontas), jogador_limpo (id canônico, ver id_jogador)
+    e classe ('' para jogadores ou a classe do termo ignorado, ver CLASSES_TERMOS).
+    Os eventos ficam na ordem da planilha: por partida, gols antes das assistências.
+    Os tipos das colunas não dependem dos valores (campeonato, ano e partida têm os tipos das
+    colunas da aba): os eventos de partes da aba, juntados, têm os mesmos tipos que os da aba inteira.
+    """
+    partes = []
+    for coluna in COLUNAS_PARTICIPACAO:
+        if coluna not in df.columns:
+            continue
+        nomes = separar_nomes(df[coluna])
+        partes.append(pd.DataFrame({"linha": nomes.index, "tipo": pd.Series(coluna, index=range(len(nomes)), dtype="str"), "jogador": nomes.astype("str").array}))
+
+    if partes:
+        eventos = pd.concat(partes, ignore_index=True).sort_values("linha", kind="stable", ignore_index=True)
+    else:
+        eventos = pd.DataFrame({"linha": pd.Series(dtype="int64"), "tipo": pd.Series(dtype="str"), "jogador": pd.Series(dtype="str")})
+
+    for coluna in ["campeonato", "ano", "partida"]:
+        # Série alinhada (e não array) para não reinferir o tipo a partir dos valores
+        eventos[coluna] = df[coluna].reindex(eventos["linha"]).set_axis(eventos.index) if coluna in df.columns else pd.NA
+    eventos["ano"] = pd.to_numeric(eventos["ano"], errors="coerce")
+    eventos["jogador_limpo"] = ids_jogadores(eventos["jogador"])
+    eventos["classe"] = classes_nomes(eventos["jogador_limpo"])
+    eventos.insert(0, "aba", aba)
+    return eventos[["aba", "linha", "campeonato", "ano", "partida", "tipo", "jogador", "jogador_limpo", "classe"]]
+
+# --- Carga ---
+
+@cronometrado("base: ids, cubo e índices")
+def montar_base(abas, partidas, faltando, eventos, cubo=None, assinaturas=None, apelidos=None):
+    """Monta o dicionário da base a partir das tabelas normalizadas, calculando os índices.
+
+    O cubo é recalculado a partir dos eventos se não for informado (ver atualizar_base). Os ids
+    dos jogadores (e a classe de cada evento) são refeitos a partir das grafias com os apelidos
+    informados, e as colunas de texto repetidas viram Categorical (ver compactar_tabela).
+
+    Chaves:
+      - 'abas': nomes das abas (competições) na ordem do arquivo;
+      - 'partidas': {aba: DataFrame normalizado com as colunas essenciais presentes};
+      - 'faltando': {aba: colunas essenciais ausentes na aba};
+      - 'eventos': tabela longa com um gol/assistência por linha (ver explodir_eventos);
+      - 'indice_jogadores': {id do jogador: posições dos eventos} (ver construir_indice_jogadores);
+      - 'nomes_por_jogador': {id do jogador: nome de exibição} (ver nomes_por_jogador);
+      - 'nomes_jogadores': nomes ordenados para a busca de jogador na interface;
+      - 'cubo': agregado (jogador, aba, campeonato, ano) para rankings e resumos (ver construir_cubo);
+      - 'indice_cubo': {id do jogador: posições das linhas do jogador no cubo};
+      - 'assinaturas': hashes das abas no arquivo de origem, para recarga incremental (ou None);
+      - 'apelidos': {apelido canonizado: id do jogador} usados nos ids (ver carregar_apelidos).
+    """
+    apelidos = apelidos or {}
+    ids = ids_jogadores(eventos["jogador"], apelidos)
+    eventos = compactar_tabela(eventos.assign(jogador_limpo=ids, classe=classes_nomes(ids)))
+    if cubo is None:
+        cubo = construir_cubo(eventos)
+    else:
+        cubo = cubo.assign(jogador_limpo=ids_jogadores(cubo["jogador"], apelidos))
+    cubo = compactar_tabela(cubo)
+    nomes = nomes_por_jogador(eventos)
+    return {
+        "abas": list(abas),
+        "partidas": {aba: compactar_tabela(df) for aba, df in partidas.items()},
+        "faltando": faltando,
+        "eventos": eventos,
+        "indice_jogadores": construir_indice_jogadores(eventos),
+        "nomes_por_jogador": nomes,
+        "nomes_jogadores": listar_nomes_jogadores(nomes),
+        "cubo": cubo,
+        "indice_cubo": construir_indice_jogadores(cubo),
+        "assinaturas": assinaturas,
+        "apelidos": apelidos,
+    }
+
+def aplicar_apelidos(base, apelidos):
+    """Base com os ids dos jogadores refeitos com outros apelidos (tabelas reaproveitadas, índices recalculados)."""
+    return montar_base(base["abas"], base["partidas"], base["faltando"], base["eventos"], base["cubo"], base["assinaturas"], apelidos)
+
+class TabelasSomenteLeitura(Mapping):
+    """Dicionário somente leitura que entrega cada DataFrame como uma cópia rasa, criada a cada acesso.
+
+    Com o copy-on-write do pandas, a cópia rasa não duplica os dados (custa dezenas de µs), e
+    qualquer alteração nela (atribuir coluna, .loc, drop(inplace=True)...) fica só na cópia:
+    o DataFrame guardado, compartilhado entre sessões e threads, nunca muda.
+    """
+
+    def __init__(self, dados):
+        self._dados = dict(dados)
+
+    def __getitem__(self, chave):
+        valor = self._dados[chave]
+        return valor.copy(deep=False) if isinstance(valor, pd.DataFrame) else valor
+
+    def __iter__(self):
+        return iter(self._dados)
+
+    def __len__(self):
+        return len(self._dados)
+
+    def __repr__(self):
+        return f"TabelasSomenteLeitura({list(self._dados)})"
+
+def congelar_base(base):
+    """Versão somente leitura da base, para compartilhar o mesmo objeto entre sessões e threads.
+
+    A base e o dicionário de partidas viram TabelasSomenteLeitura (cada acesso a uma tabela
+    devolve uma cópia rasa, ver acima), os outros dicionários viram MappingProxyType, as listas
+    viram tuplas e as posições dos índices de jogadores ficam não graváveis.
+    """
+    congelada = {}
+    for chave, valor in base.items():
+        if chave in ["indice_jogadores", "indice_cubo"]:
+            for posicoes in valor.values():
+                posicoes.flags.writeable = False
+        if chave == "partidas":
+            valor = TabelasSomenteLeitura(valor)
+        elif isinstance(valor, dict):
+            valor = MappingProxyType(valor)
+        elif isinstance(valor, list):
+            valor = tuple(valor)
+        congelada[chave] = valor
+    return TabelasSomenteLeitura(congelada)
+
+def _valor_celula(valor):
+    """Valor da célula como o pd.read_excel o entrega: números inteiros como int e textos vazios/erros como None."""
+    if isinstance(valor, float) and valor.is_integer():
+        return int(valor)
+    if isinstance(valor, str) and valor in TEXTOS_VAZIOS:
+        return None
+    return valor
+
+def _ano_celula(valor):
+    """Ano da célula como número (None se não for numérico), para o filtro de anos da leitura."""
+    try:
+        return float(valor) if valor is not None and not isinstance(valor, bool) else None
+    except (TypeError, ValueError):
+        return None
+
+def ler_aba_em_blocos(planilha, anos=None, tamanho_bloco=None):
+    """Lê uma aba aberta pelo openpyxl em modo read_only, em DataFrames de até tamanho_bloco (padrão TAMANHO_BLOCO) partidas.
+
+    Só as COLUNAS_ESSENCIAIS presentes no cabeçalho (primeira linha) são extraídas de cada linha,
+    sem montar a aba inteira em memória. Os blocos são indexados pela posição da partida na aba
+    (0 = primeira linha depois do cabeçalho) e, como no pd.read_excel, linhas vazias no fim da aba
+    são descartadas. Com anos, as partidas de outros anos (ou sem ano) são descartadas na leitura.
+    Sempre gera ao menos um bloco (vazio, se for o caso), com as colunas encontradas.
+    """
+    tamanho_bloco = tamanho_bloco or TAMANHO_BLOCO
+    linhas = planilha.iter_rows(values_only=True)
+    posicoes = {}
+    for i, nome in enumerate(next(linhas, None) or ()):
+        nome = limpar_nome(nome) if nome is not None else None
+        if nome in COLUNAS_ESSENCIAIS and nome not in posicoes: # Como em normalizar_aba, vale a primeira coluna repetida
+            posicoes[nome] = i
+    colunas = [c for c in COLUNAS_ESSENCIAIS if c in posicoes]
+    anos = None if anos is None else {float(ano) for ano in anos}
+
+    indice, valores = [], {c: [] for c in colunas}
+    vazias = [] # Linhas vazias só entram se houver outra linha com dados depois delas
+    gerou = False
+    for posicao, linha in enumerate(linhas):
+        if all(celula is None or celula == "" for celula in linha):
+            if anos is None:
+                vazias.append(posicao)
+            continue
+        celulas = {c: _valor_celula(linha[i]) if i < len(linha) else None for c, i in posicoes.items()}
+        if anos is not None and _ano_celula(celulas.get("ano")) not in anos:
+            continue
+        for vazia in vazias:
+            indice.append(vazia)
+            for c in colunas:
+                valores[c].append(None)
+        vazias.clear()
+        indice.append(posicao)
+        for c in colunas:
+            valores[c].append(celulas[c])
+        if len(indice) >= tamanho_bloco:
+            yield _bloco(valores, indice, colunas)
+            gerou = True
+            indice, valores = [], {c: [] for c in colunas}
+    if indice or not gerou:
+        yield _bloco(valores, indice, colunas)
+
+def _bloco(valores, indice, colunas):
+    """DataFrame de um bloco de ler_aba_em_blocos; colunas sem nenhum valor viram NaN (float), como no pd.read_excel."""
+    valores = {c: v if any(x is not None for x in v) else [float("nan")] * len(v) for c, v in valores.items()}
+    return pd.DataFrame(valores, index=pd.Index(indice, dtype="int64"), columns=colunas)
+
+def _amostrar_tipos(bloco, amostra):
+    """Acrescenta à amostra ({coluna: {tipo: valor}}) um valor de cada tipo presente nas colunas do bloco bruto.
+
+    Células vazias entram como NaN. O tipo que o pd.read_excel daria a uma coluna da aba inteira
+    só depende dos tipos presentes nela, então a amostra de todos os blocos basta para reconstituí-lo.
+    """
+    for coluna in bloco.columns:
+        tipos = amostra.setdefault(coluna, {})
+        serie = bloco[coluna]
+        vazias = serie.isna()
+        if vazias.any():
+            tipos.setdefault(None, float("nan"))
+        valores = serie[~vazias].tolist()
+        for tipo, valor in dict(zip(map(type, valores), valores)).items():
+            tipos.setdefault(tipo, valor)
+
+def _tipos_normalizados(amostra):
+    """Tipos das colunas da aba inteira normalizada (ver normalizar_aba), calculados sobre a amostra dos blocos.
+
+    Um bloco sem texto numa coluna (ou com um número no meio dos textos) é normalizado com outro
+    tipo que a aba inteira. 'ano' fica de fora: o pd.to_numeric depende dos valores, e a junção dos
+    blocos normalizados já dá o mesmo tipo que a aba inteira.
+    """
+    valores = {coluna: list(tipos.values()) for coluna, tipos in amostra.items()}
+    linhas = max(map(len, valores.values()), default=0)
+    # Colunas completadas com o próprio primeiro valor: o conjunto de tipos de cada uma não muda
+    df = pd.DataFrame({coluna: v + v[:1] * (linhas - len(v)) for coluna, v in valores.items()})
+    return normalizar_aba(df).dtypes.drop("ano", errors="ignore")
+
+def processar_aba(arquivo, aba, planilha=None, anos=None):
+    """Lê a aba em fluxo (ver ler_aba_em_blocos), normaliza as partidas e explode os eventos.
+
+    Cada bloco é normalizado e explodido assim que é lido, e descartado antes do próximo: só as
+    partidas normalizadas e os eventos (e, com anos, só os desses anos) ficam em memória, nunca a
+    aba bruta inteira. Juntados, os pedaços recebem os tipos que a aba inteira lida pelo
+    pd.read_excel teria (ver _tipos_normalizados).
+    planilha é a aba já aberta pelo openpyxl; sem ela, o arquivo é aberto só para esta aba.
+    Função de módulo (e não closure) para poder rodar nos workers do ProcessPoolExecutor.
+    Retorna (aba, partidas normalizadas, colunas essenciais faltando, eventos).
+    """
+    if planilha is None:
+        livro = load_workbook(arquivo, read_only=True, data_only=True, keep_links=False)
+        try:
+            return processar_aba(arquivo, aba, livro[aba], anos)
+        finally:
+            livro.close()
+
+    partes, eventos, amostra = [], [], {}
+    for bloco in ler_aba_em_blocos(planilha, anos):
+        _amostrar_tipos(bloco, amostra)
+        partes.append(normalizar_aba(bloco))
+        eventos.append(explodir_eventos(partes[-1], aba))
+        del bloco # Libera o bloco bruto antes da leitura do próximo
+    if len(partes) == 1:
+        df, eventos = partes[0], eventos[0]
+    else:
+        df = pd.concat(partes).astype(_tipos_normalizados(amostra).to_dict())
+        del partes
+        # Os eventos herdam os tipos das colunas das partidas (ver explodir_eventos)
+        eventos = pd.concat(eventos, ignore_index=True).astype({c: df[c].dtype for c in ["campeonato", "ano", "partida"] if c in df.columns})
+    faltando = [c for c in COLUNAS_ESSENCIAIS if c not in df.columns]
+    return aba, df, faltando, eventos
+
+def numero_workers(workers=None):
+    """Quantidade de processos para ler as abas: argumento, variável CRUZEIRO_WORKERS ou 1 (serial)."""
+    if workers is None:
+        try:
+            workers = int(os.environ.get("CRUZEIRO_WORKERS", "1"))
+        except ValueError:
+            workers = 1
+    return max(1, workers)
+
+def ler_abas_em_paralelo(arquivo, workers, abas=None, anos=None):
+    """Lê e normaliza as abas em paralelo; cada worker abre o arquivo e lê só a sua aba."""
+    if abas is None:
+        abas = abas_planilha(arquivo)
+    if not abas:
+        return []
+    with ProcessPoolExecutor(max_workers=min(workers, len(abas))) as pool:
+        medidos = list(pool.map(_processar_aba_medida, [arquivo] * len(abas), abas, [anos] * len(abas))) # map preserva a ordem das abas
+    for (aba, _, _, _), segundos in medidos:
+        registrar_tempo(f"aba: {aba}", segundos) # O tempo medido no worker inclui a leitura da aba
+    return [resultado for resultado, _ in medidos]
+
+def _processar_aba_medida(arquivo, aba, anos=None):
+    """processar_aba num worker do pool, devolvendo também o tempo (o worker não compartilha as medições)."""
+    inicio = time.perf_counter()
+    resultado = processar_aba(arquivo, aba, anos=anos)
+    return resultado, time.perf_counter() - inicio
+
+def ler_abas(arquivo, abas=None, workers=None, anos=None):
+    """Lê, normaliza e explode as abas informadas (todas, se abas for None); ver processar_aba.
+
+    As abas são lidas em fluxo (ver ler_aba_em_blocos), só com as colunas essenciais e, com anos,
+    só com as partidas desses anos. Com mais de um worker (ver numero_workers), as abas são lidas
+    em processos separados; se o pool não puder ser usado, cai para a leitura serial, com o
+    arquivo aberto uma vez só. Cada aba (leitura inclusa) é medida como a etapa 'aba: <nome>'; na
+    leitura serial, a abertura do arquivo (textos compartilhados) é medida em 'excel: abertura'.
+    """
+    if abas is not None and not abas:
+        return []
+    if numero_workers(workers) > 1:
+        try:
+            return ler_abas_em_paralelo(arquivo, numero_workers(workers), abas, anos)
+        except Exception:
+            pass # Ex.: ambiente sem suporte a multiprocessing; segue na leitura serial
+    with medir("excel: abertura"):
+        livro = load_workbook(arquivo, read_only=True, data_only=True, keep_links=False)
+    try:
+        resultados = []
+        for aba in (abas if abas is not None else livro.sheetnames):
+            with medir(f"aba: {aba}"):
+                resultados.append(processar_aba(arquivo, aba, livro[aba], anos))
+        return resultados
+    finally:
+        livro.close()
+
+@cronometrado("excel: leitura completa")
+def ler_planilha(arquivo, workers=None, anos=None):
+    """Lê todas as abas do Excel e devolve a base normalizada (ver montar_base e ler_abas).
+
+    Com anos, a base só tem as partidas desses anos; sem as assinaturas das abas, ela não serve
+    de ponto de partida para a recarga incremental.
+    """
+    assinaturas = assinaturas_planilha(arquivo) if anos is None else None
+    resultados = ler_abas(arquivo, workers=workers, anos=anos)
+
+    abas = [aba for aba, _, _, _ in resultados]
+    partidas = {aba: df for aba, df, _, _ in resultados}
+    faltando = {aba: cols for aba, _, cols, _ in resultados}
+    eventos = [ev for _, _, _, ev in resultados]
+    eventos = pd.concat(eventos, ignore_index=True) if eventos else explodir_eventos(pd.DataFrame(), "")
+    return montar_base(abas, partidas, faltando, eventos, assinaturas=assinaturas)
+
+# --- Recarga incremental ---
+
+def _partes_xlsx(z):
+    """Mapeia, dentro do zip do .xlsx, cada aba para o seu XML e localiza a tabela de textos compartilhados."""
+    workbook = ElementTree.fromstring(z.read("xl/workbook.xml"))
+    rels = ElementTree.fromstring(z.read("xl/_rels/workbook.xml.rels"))
+
+    def caminho(destino): # Destinos podem ser absolutos ('/xl/...') ou relativos a 'xl/'
+        return destino.lstrip("/") if destino.startswith("/") else f"xl/{destino}"
+
+    destinos = {rel.get("Id"): caminho(rel.get("Target")) for rel in rels}
+    abas = {sheet.get("name"): destinos[sheet.get(f"{{{_NS_RELACOES}}}id")] for sheet in workbook.iter(f"{{{_NS_PLANILHA}}}sheet")}
+    textos = next((caminho(rel.get("Target")) for rel in rels if rel.get("Type", "").endswith("/sharedStrings")), None)
+    return abas, textos
+
+def _itens_textos(z, caminho_textos):
+    """Itens (<si>) da tabela de textos compartilhados, na ordem em que as abas os referenciam."""
+    return _ITEM_TEXTO.findall(z.read(caminho_textos)) if caminho_textos else []
+
+def abas_planilha(arquivo):
+    """Nomes das abas do .xlsx na ordem do arquivo, sem ler as células."""
+    with zipfile.ZipFile(arquivo) as z:
+        return list(_partes_xlsx(z)[0])
+
+def assinaturas_planilha(arquivo):
+    """Hash do XML de cada aba dentro do .xlsx, mais um resumo da tabela de textos compartilhados.
+
+    Retorna {'abas': {aba: sha1 do XML da aba}, 'textos': {'n': quantidade, 'hash': sha1 dos n textos}}
+    ou None se o arquivo não puder ser lido como .xlsx (a recarga incremental fica desligada).
+    """
+    try:
+        with zipfile.ZipFile(arquivo) as z:
+            partes, caminho_textos = _partes_xlsx(z)
+            abas = {aba: hashlib.sha1(z.read(parte)).hexdigest() for aba, parte in partes.items()}
+            itens = _itens_textos(z, caminho_textos)
+    except (OSError, KeyError, zipfile.BadZipFile, ElementTree.ParseError):
+        return None
+    return {"abas": abas, "textos": {"n": len(itens), "hash": hashlib.sha1(b"".join(itens)).hexdigest()}}
+
+def textos_compativeis(antigas, novas, arquivo):
+    """Indica se os textos compartilhados antigos continuam nas mesmas posições do arquivo novo.
+
+    As abas guardam índices para essa tabela; o Excel só acrescenta textos no fim dela, mas se
+    ela for reordenada as abas inalteradas passariam a apontar para outros textos.
+    """
+    if antigas["textos"] == novas["textos"]:
+        return True
+    if novas["textos"]["n"] < antigas["textos"]["n"]:
+        return False
+    with zipfile.ZipFile(arquivo) as z:
+        itens = _itens_textos(z, _partes_xlsx(z)[1])
+    return hashlib.sha1(b"".join(itens[:antigas["textos"]["n"]])).hexdigest() == antigas["textos"]["hash"]
+
+@cronometrado("excel: recarga incremental")
+def atualizar_base(base, arquivo, workers=None):
+    """Recarrega só as abas novas ou alteradas do arquivo, reaproveitando o resto da base.
+
+    As partidas, os eventos e o cubo das abas inalteradas são mantidos; os das abas relidas
+    entram no lugar (na ordem das abas do arquivo) e abas removidas saem. Sem assinaturas
+    comparáveis, faz a leitura completa (ler_planilha).
+    """
+    antigas = base.get("assinaturas")
+    novas = assinaturas_planilha(arquivo)
+    if not antigas or not novas or not textos_compativeis(antigas, novas, arquivo):
+        return ler_planilha(arquivo, workers)
+
+    abas = list(novas["abas"])
+    relidas = [aba for aba in abas if aba not in base["partidas"] or antigas["abas"].get(aba) != novas["abas"][aba]]
+    resultados = {aba: (df, cols, ev) for aba, df, cols, ev in ler_abas(arquivo, relidas, workers)}
+
+    eventos_por_aba = dict(tuple(base["eventos"].groupby("aba", sort=False, observed=True)))
+    cubo_por_aba = dict(tuple(base["cubo"].groupby("aba", sort=False, observed=True)))
+    partidas, faltando, eventos, cubos = {}, {}, [], []
+    for aba in abas:
+        if aba in resultados:
+            partidas[aba], faltando[aba], eventos_aba = resultados[aba]
+            cubo_aba = construir_cubo(eventos_aba)
+        else:
+            partidas[aba], faltando[aba] = base["partidas"][aba], base["faltando"][aba]
+            eventos_aba = eventos_por_aba.get(aba, base["eventos"].iloc[0:0])
+            cubo_aba = cubo_por_aba.get(aba, base["cubo"].iloc[0:0])
+        eventos.append(eventos_aba)
+        cubos.append(cubo_aba)
+
+    # O cubo é agrupado por aba, então os pedaços por aba concatenados na ordem das abas
+    # são iguais ao cubo calculado do zero sobre todos os eventos
+    eventos = pd.concat(eventos, ignore_index=True) if eventos else base["eventos"].iloc[0:0]
+    cubo = pd.concat(cubos, ignore_index=True) if cubos else base["cubo"].iloc[0:0]
+    return montar_base(abas, partidas, faltando, eventos, cubo, novas)
+
+# --- Snapshot colunar (Feather) ---
+
+def caminho_snapshot(arquivo):
+    """Pasta do snapshot colunar, ao lado da planilha (ex.: '.Cruzeiro Mineiro.xlsx.snapshot')."""
+    pasta, nome = os.path.split(os.path.abspath(arquivo))
+    return os.path.join(pasta, f".{nome}.snapshot")
+
+@cronometrado("snapshot: gravação")
+def salvar_snapshot(base, arquivo, mtime, hash_arquivo):
+    """Grava partidas e eventos em Feather, com um manifesto da versão da planilha de origem."""
+    from pyarrow import feather # Dependência do próprio Streamlit; importada só quando usada
+
+    pasta = caminho_snapshot(arquivo)
+    os.makedirs(pasta, exist_ok=True)
+    partidas = pd.concat(
+        [df.rename_axis("linha").reset_index().assign(aba=aba) for aba, df in base["partidas"].items()],
+        ignore_index=True
+    ) if base["partidas"] else pd.DataFrame({"aba": [], "linha": []})
+    feather.write_feather(partidas, os.path.join(pasta, "partidas.feather"))
+    feather.write_feather(base["eventos"].reset_index(drop=True), os.path.join(pasta, "eventos.feather"))
+    anos = partidas["ano"].dropna() if "ano" in partidas.columns else partidas.iloc[0:0]
+
+    manifesto = {
+        "versao": VERSAO_SNAPSHOT,
+        "mtime": mtime,
+        "hash": hash_arquivo,
+        "abas": list(base["abas"]),
+        "faltando": {aba: list(colunas) for aba, colunas in base["faltando"].items()},
+        # Tipos das colunas não categóricas de cada aba: as abas são gravadas juntas, e uma coluna
+        # toda vazia (float64) de uma aba viraria texto ao lado da mesma coluna das outras
+        "tipos": {
+            aba: {coluna: str(tipo) for coluna, tipo in df.dtypes.items() if coluna not in COLUNAS_CATEGORICAS}
+            for aba, df in base["partidas"].items()
+        },
+        "assinaturas": dict(base["assinaturas"]) if base["assinaturas"] else None, # Permite recarga incremental a partir do snapshot
+        "anos": [int(anos.min()), int(anos.max())] if len(anos) else None, # Faixa de anos das partidas (ver cruzeiro_acervo)
+    }
+    # O manifesto é escrito por último (e de forma atômica): sem ele o snapshot é ignorado
+    caminho_tmp = os.path.join(pasta, "manifesto.json.tmp")
+    with open(caminho_tmp, "w", encoding="utf-8") as f:
+        json.dump(manifesto, f, ensure_ascii=False)
+    os.replace(caminho_tmp, os.path.join(pasta, "manifesto.json"))
+
+def ler_manifesto_snapshot(arquivo, mtime=None, hash_arquivo=None):
+    """Manifesto do snapshot da planilha, ou None se não houver snapshot válido para o (mtime, hash) informado."""
+    try:
+        with open(os.path.join(caminho_snapshot(arquivo), "manifesto.json"), encoding="utf-8") as f:
+            manifesto = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if manifesto.get("versao") != VERSAO_SNAPSHOT:
+        return None # Formato antigo
+    if mtime is not None and (manifesto.get("mtime"), manifesto.get("hash")) != (mtime, hash_arquivo):
+        return None # Planilha mudou: o snapshot está desatualizado
+    return manifesto
+
+@cronometrado("snapshot: leitura")
+def carregar_snapshot(arquivo, mtime=None, hash_arquivo=None):
+    """Carrega a base do snapshot (leitura mapeada em memória) se ele for da mesma versão da planilha.
+
+    Retorna None se não houver snapshot válido para o (mtime, hash) informado. Sem mtime e
+    hash, aceita o snapshot de qualquer versão da planilha (ponto de partida da recarga incremental).
+    """
+    manifesto = ler_manifesto_snapshot(arquivo, mtime, hash_arquivo)
+    if manifesto is None:
+        return None
+
+    pasta = caminho_snapshot(arquivo)
+    from pyarrow import feather
+    partidas_todas = feather.read_table(os.path.join(pasta, "partidas.feather"), memory_map=True).to_pandas()
+    eventos = feather.read_table(os.path.join(pasta, "eventos.feather"), memory_map=True).to_pandas()
+
+    partidas = {}
+    grupos = dict(tuple(partidas_todas.groupby("aba", sort=False)))
+    for aba in manifesto["abas"]:
+        colunas = [c for c in COLUNAS_ESSENCIAIS if c not in manifesto["faltando"][aba]]
+        df = grupos[aba] if aba in grupos else partidas_todas.iloc[0:0]
+        partidas[aba] = df.set_index("linha").rename_axis(None)[colunas].astype(manifesto["tipos"][aba])
+    return montar_base(manifesto["abas"], partidas, manifesto["faltando"], eventos, assinaturas=manifesto.get("assinaturas"))
+
+@cronometrado("base: carga")
+def carregar_base(arquivo, usar_snapshot=True, workers=None, manter_em_memoria=True, anos=None):
+    """Carrega a base normalizada, relendo do Excel só o que mudou desde a última carga.
+
+    Ordem de tentativa: a base já carregada neste processo (mesmo mtime/hash), o snapshot
+    colunar atualizado e, se a planilha mudou, a recarga incremental (atualizar_base) a partir
+    da última base conhecida (em memória ou no snapshot antigo). Sem nenhuma delas, lê o Excel
+    inteiro (ler_planilha). O snapshot é regravado após cada leitura do Excel; falhas ao gravar
+    (ex.: disco somente leitura) não impedem a carga. workers controla a leitura paralela das abas.
+    Os apelidos (ver carregar_apelidos) são aplicados por último e não entram no snapshot; se só
+    o arquivo de apelidos mudar, apenas os ids e índices são refeitos. A origem de cada carga
+    é contada em 'base: <origem>' (ver cruzeiro_diagnostico.contadores).
+
+    A base devolvida é somente leitura (ver congelar_base) e é a mesma para todos os chamadores:
+    chamadas simultâneas (sessões do app, threads da API) esperam uma única carga. Com
+    manter_em_memoria=False, a base não fica guardada neste processo (ex.: as planilhas de um
+    acervo, ver cruzeiro_acervo, que só vivem até serem combinadas).
+
+    Com anos, lê do Excel só as partidas desses anos (ver ler_aba_em_blocos), sem snapshot e sem
+    guardar a base: para consultas pontuais em planilhas grandes demais para carregar inteiras.
+    """
+    if anos is not None:
+        contar("base: excel (anos)")
+        base = ler_planilha(arquivo, workers, anos)
+        return congelar_base(aplicar_apelidos(base, carregar_apelidos(arquivo)))
+    mtime, hash_arquivo = assinatura_arquivo(arquivo)
+    versao = (mtime, hash_arquivo, assinatura_apelidos(arquivo))
+    chave = os.path.abspath(arquivo)
+    anterior = _BASES_CARREGADAS.get(chave)
+    if anterior is None or anterior[:3] != versao:
+        with _TRAVA_CARGA:
+            anterior = _BASES_CARREGADAS.get(chave) # Outra thread pode ter carregado esta versão enquanto esperava
+            if anterior is None or anterior[:3] != versao:
+                base = _recarregar_base(arquivo, mtime, hash_arquivo, anterior, usar_snapshot, workers)
+                if manter_em_memoria:
+                    _BASES_CARREGADAS[chave] = versao + (base,)
+                return base
+    contar("base: memória")
+    return anterior[3]
+
+def _recarregar_base(arquivo, mtime, hash_arquivo, anterior, usar_snapshot, workers):
+    """Carga de carregar_base quando a versão em memória não serve; roda com _TRAVA_CARGA."""
+    base_anterior = anterior[3] if anterior is not None else None
+
+    base = None
+    if anterior is not None and anterior[:2] == (mtime, hash_arquivo):
+        base = base_anterior # Só os apelidos mudaram
+        contar("base: só apelidos")
+    elif usar_snapshot:
+        try:
+            base = carregar_snapshot(arquivo, mtime, hash_arquivo)
+            if base is not None:
+                contar("base: snapshot")
+            if base is None and base_anterior is None:
+                base_anterior = carregar_snapshot(arquivo) # Versão antiga, reaproveitada abaixo
+        except Exception:
+            base = None # Snapshot corrompido ou ilegível: refaz a partir do Excel
+
+    if base is None:
+        contar("base: recarga incremental" if base_anterior is not None else "base: excel")
+        base = atualizar_base(base_anterior, arquivo, workers) if base_anterior is not None else ler_planilha(arquivo, workers)
+        if usar_snapshot:
+            try:
+                salvar_snapshot(base, arquivo, mtime, hash_arquivo)
+            except Exception:
+                pass # O snapshot é só uma otimização
+
+    apelidos = carregar_apelidos(arquivo)
+    if apelidos != base["apelidos"]:
+        base = aplicar_apelidos(base, apelidos)
+    return congelar_base(base)
+
+def estatisticas_caches():
+    """Acertos e falhas das memoizações da carga (nomes canonizados e classes de lance)."""
+    return {
+        nome: {"acertos": info.hits, "falhas": info.misses}
+        for nome, info in [("canonizar_nome", canonizar_nome.cache_info()), ("classificar_nome", classificar_nome.cache_info())]
+    }
+
+def main(argv=None):
+    """CLI: gera o snapshot colunar da planilha antecipadamente (ex.: no build da imagem)."""
+    parser = argparse.ArgumentParser(description="Gera o snapshot colunar (Feather) da planilha do Cruzeiro.")
+    parser.add_argument("arquivo", nargs="?", default="Cruzeiro Mineiro.xlsx", help="Planilha de origem (padrão: %(default)s)")
+    parser.add_argument("--workers", type=int, default=None, help="Processos para ler as abas (padrão: CRUZEIRO_WORKERS ou 1)")
+    args = parser.parse_args(argv)
+
+    mtime, hash_arquivo = assinatura_arquivo(args.arquivo)
+    inicio = time.perf_counter()
+    base = ler_planilha(args.arquivo, args.workers)
+    salvar_snapshot(base, args.arquivo, mtime, hash_arquivo)
+    memoria = memoria_base(base)
+    print(f"Snapshot gravado em '{caminho_snapshot(args.arquivo)}': {len(base['abas'])} abas, "
+          f"{len(base['eventos'])} eventos ({time.perf_counter() - inicio:.2f}s)")
+    print("Memória: " + ", ".join(f"{tabela} {tamanho / 1e6:.2f} MB" for tabela, tamanho in memoria.items()))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""Tempos por etapa (carga, abas, análises, renderização), contadores de cache e cProfile, sem Streamlit.
+
+Os registros valem para o processo inteiro (todas as sessões do app ou requisições da API);
+o painel de diagnóstico do app e a rota /estatisticas da API os leem com tempos_etapas() e
+contadores(). O custo de medir é só um perf_counter() no começo e no fim de cada etapa.
+"""
+
+import cProfile
+import functools
+import io
+import pstats
+import threading
+import time
+from contextlib import contextmanager
+
+_TRAVA = threading.Lock() # A API mede etapas em várias threads
+_ETAPAS = {} # etapa -> {"chamadas", "total", "ultimo", "maximo"} (segundos)
+_CONTADORES = {} # nome -> quantidade
+
+# --- Tempos ---
+
+def registrar_tempo(etapa, segundos):
+    """Acumula uma medição da etapa."""
+    with _TRAVA:
+        dados = _ETAPAS.setdefault(etapa, {"chamadas": 0, "total": 0.0, "ultimo": 0.0, "maximo": 0.0})
+        dados["chamadas"] += 1
+        dados["total"] += segundos
+        dados["ultimo"] = segundos
+        dados["maximo"] = max(dados["maximo"], segundos)
+
+@contextmanager
+def medir(etapa):
+    """Mede o bloco como uma execução da etapa (inclusive se ele terminar com exceção)."""
+    inicio = time.perf_counter()
+    try:
+        yield
+    finally:
+        registrar_tempo(etapa, time.perf_counter() - inicio)
+
+def cronometrado(etapa):
+    """Decorador: cada chamada da função é medida como uma execução da etapa."""
+    def decorador(funcao):
+        @functools.wraps(funcao)
+        def funcao_medida(*args, **kwargs):
+            with medir(etapa):
+                return funcao(*args, **kwargs)
+        return funcao_medida
+    return decorador
+
+def tempos_etapas():
+    """Medições por etapa, na ordem da primeira medição: etapa, chamadas e tempos em ms (último, médio, máximo, total)."""
+    with _TRAVA:
+        return [
+            {
+                "etapa": etapa,
+                "chamadas": dados["chamadas"],
+                "ultimo_ms": dados["ultimo"] * 1000,
+                "media_ms": dados["total"] / dados["chamadas"] * 1000,
+                "maximo_ms": dados["maximo"] * 1000,
+                "total_ms": dados["total"] * 1000,
+            }
+            for etapa, dados in _ETAPAS.items()
+        ]
+
+# --- Contadores ---
+
+def contar(nome, quantidade=1):
+    """Soma quantidade ao contador (ex.: acertos e falhas de um cache)."""
+    with _TRAVA:
+        _CONTADORES[nome] = _CONTADORES.get(nome, 0) + quantidade
+
+def contadores():
+    with _TRAVA:
+        return dict(_CONTADORES)
+
+def taxa_acertos(acertos, falhas):
+    """Fração de acertos (None sem consultas)."""
+    return acertos / (acertos + falhas) if acertos + falhas else None
+
+# --- cProfile ---
+
+def iniciar_perfil():
+    """Liga o cProfile (ex.: no começo de um rerun); encerre com finalizar_perfil, mesmo se o rerun falhar.
+
+    Retorna None se outro perfil já estiver ligado: a partir do Python 3.12 só um por processo,
+    e os reruns de outras sessões seguem sem perfil em vez de falhar.
+    """
+    perfil = cProfile.Profile()
+    try:
+        perfil.enable()
+    except ValueError:
+        contar("perfil: outro já ativo")
+        return None
+    return perfil
+
+def finalizar_perfil(perfil, caminho=None, linhas=30):
+    """Desliga o perfil, grava o .prof em caminho (se informado) e devolve o resumo por tempo acumulado."""
+    perfil.disable()
+    if caminho:
+        perfil.dump_stats(caminho)
+    texto = io.StringIO()
+    pstats.Stats(perfil, stream=texto).sort_stats("cumulative").print_stats(linhas)
+    return texto.getvalue()
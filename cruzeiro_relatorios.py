@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+"""Pré-calcula todos os relatórios do app em arquivos estáticos (CSV/JSON/Parquet), sem Streamlit.
+
+Uso:
+    python cruzeiro_relatorios.py --saida relatorios --formatos csv json --workers 4
+
+Estrutura gerada em --saida:
+    ranking/<competição>.<ext>               Ranking Geral (inclui 'todas')
+    ano/<competição>/<ano>.<ext>             Análise por Ano, para cada ano com participações
+    lances/<competição>.<ext>                Pênaltis, gols contra e outros lances especiais
+    jogadores/<jogador>/<análise>.<ext>      Números gerais, jogos, gols e assistências de cada jogador
+    indice.json                              Nomes originais de competições/jogadores -> caminhos
+"""
+
+import argparse
+import json
+import os
+import re
+import time
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor
+
+from cruzeiro_analises import ANALISES_POR_JOGADOR, analise_por_ano, executar_analise, lances_especiais, ranking
+from cruzeiro_dados import carregar_base, numero_workers
+
+FORMATOS = ["csv", "json", "parquet"]
+
+# Base carregada em cada worker do pool (ver _iniciar_worker)
+_BASE_WORKER = None
+
+# --- Arquivos ---
+
+def slug(texto):
+    """Nome de arquivo seguro: sem acentos, minúsculo, só letras, números e '-'."""
+    texto = unicodedata.normalize("NFKD", str(texto)).encode("ascii", "ignore").decode("ascii")
+    return re.sub(r"[^a-z0-9]+", "-", texto.lower()).strip("-") or "sem-nome"
+
+def slugs_unicos(nomes):
+    """Slug de cada nome, com sufixo numérico quando dois nomes geram o mesmo slug."""
+    usados = {}
+    resultado = {}
+    for nome in nomes:
+        base_slug = slug(nome)
+        usados[base_slug] = usados.get(base_slug, 0) + 1
+        resultado[nome] = base_slug if usados[base_slug] == 1 else f"{base_slug}-{usados[base_slug]}"
+    return resultado
+
+def salvar_tabela(df, caminho, formatos):
+    """Grava o DataFrame em caminho.<ext> para cada formato pedido."""
+    os.makedirs(os.path.dirname(caminho), exist_ok=True)
+    for formato in formatos:
+        if formato == "csv":
+            df.to_csv(f"{caminho}.csv", index=False)
+        elif formato == "json":
+            df.to_json(f"{caminho}.json", orient="records", force_ascii=False)
+        elif formato == "parquet":
+            # Colunas com tipos misturados (ex.: 'Ano' com 'Total') viram texto para o Arrow
+            mistas = [c for c in df.columns if df[c].dtype == object and df[c].dropna().map(type).nunique() > 1]
+            df.astype({c: "string" for c in mistas}).to_parquet(f"{caminho}.parquet", index=False)
+
+# --- Relatórios ---
+
+def gerar_rankings(base, saida, formatos, slugs_competicoes):
+    """Ranking Geral e lances especiais de cada competição e Análise por Ano de cada (competição, ano) com dados."""
+    arquivos = 0
+    for competicao in ["Todas"] + list(base["abas"]):
+        pasta = slugs_competicoes[competicao]
+        salvar_tabela(ranking(base, competicao), os.path.join(saida, "ranking", pasta), formatos)
+        salvar_tabela(lances_especiais(base, competicao), os.path.join(saida, "lances", pasta), formatos)
+        arquivos += 2
+
+        cubo = base["cubo"] if competicao == "Todas" else base["cubo"][base["cubo"]["aba"] == competicao]
+        for ano in sorted(cubo["ano"].dropna().astype(int).unique()):
+            salvar_tabela(analise_por_ano(base, competicao, int(ano)), os.path.join(saida, "ano", pasta, str(ano)), formatos)
+            arquivos += 1
+    return arquivos
+
+def gerar_relatorios_jogadores(base, jogadores, saida, formatos):
+    """Relatórios por jogador (todas as competições e anos); jogadores é uma lista de (nome, slug)."""
+    arquivos = 0
+    for nome, pasta in jogadores:
+        for analise in ANALISES_POR_JOGADOR:
+            df = executar_analise(base, analise, jogador=nome)
+            salvar_tabela(df, os.path.join(saida, "jogadores", pasta, analise), formatos)
+            arquivos += 1
+    return arquivos
+
+def _iniciar_worker(arquivo):
+    """Carrega a base uma vez por processo (do snapshot, se estiver atualizado)."""
+    global _BASE_WORKER
+    _BASE_WORKER = carregar_base(arquivo)
+
+def _gerar_lote_jogadores(jogadores, saida, formatos):
+    """Tarefa do pool: gera os relatórios de um lote de jogadores com a base do worker."""
+    return gerar_relatorios_jogadores(_BASE_WORKER, jogadores, saida, formatos)
+
+def gerar_relatorios(arquivo, saida, formatos=("csv",), workers=None, tamanho_lote=50):
+    """Carrega a planilha uma vez e grava todos os relatórios; devolve a quantidade de arquivos por tipo.
+
+    Os relatórios por jogador são divididos em lotes entre processos (ver numero_workers); com
+    um worker só, tudo roda no processo atual.
+    """
+    base = carregar_base(arquivo, workers=workers)
+    slugs_competicoes = slugs_unicos(["Todas"] + list(base["abas"]))
+    slugs_jogadores = slugs_unicos(base["nomes_jogadores"])
+    jogadores = list(slugs_jogadores.items())
+
+    contagem = {"rankings": gerar_rankings(base, saida, formatos, slugs_competicoes)}
+    lotes = [jogadores[i:i + tamanho_lote] for i in range(0, len(jogadores), tamanho_lote)]
+    if numero_workers(workers) > 1 and len(lotes) > 1:
+        # A base é carregada em cada worker (o snapshot já foi gravado acima), em vez de ser serializada por tarefa
+        with ProcessPoolExecutor(max_workers=numero_workers(workers), initializer=_iniciar_worker, initargs=(arquivo,)) as pool:
+            contagem["jogadores"] = sum(pool.map(_gerar_lote_jogadores, lotes, [saida] * len(lotes), [formatos] * len(lotes)))
+    else:
+        contagem["jogadores"] = gerar_relatorios_jogadores(base, jogadores, saida, formatos)
+
+    indice = {
+        "arquivo": os.path.basename(arquivo),
+        "formatos": list(formatos),
+        "competicoes": slugs_competicoes,
+        "jogadores": slugs_jogadores,
+    }
+    with open(os.path.join(saida, "indice.json"), "w", encoding="utf-8") as f:
+        json.dump(indice, f, ensure_ascii=False, indent=2)
+    return contagem
+
+def main(argv=None):
+    """CLI: gera todos os relatórios em --saida."""
+    parser = argparse.ArgumentParser(description="Pré-calcula os relatórios do app em arquivos estáticos.")
+    parser.add_argument("arquivo", nargs="?", default="Cruzeiro Mineiro.xlsx", help="Planilha de origem (padrão: %(default)s)")
+    parser.add_argument("--saida", default="relatorios", help="Pasta de saída (padrão: %(default)s)")
+    parser.add_argument("--formatos", nargs="+", choices=FORMATOS, default=["csv"], help="Formatos de arquivo (padrão: csv)")
+    parser.add_argument("--workers", type=int, default=None, help="Processos para os relatórios por jogador (padrão: CRUZEIRO_WORKERS ou 1)")
+    args = parser.parse_args(argv)
+
+    inicio = time.perf_counter()
+    contagem = gerar_relatorios(args.arquivo, args.saida, args.formatos, args.workers)
+    print(f"{contagem['rankings']} tabelas de competição e {contagem['jogadores']} relatórios de jogadores "
+          f"({', '.join(args.formatos)}) gravados em '{args.saida}' ({time.perf_counter() - inicio:.1f}s)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,319 @@
+# -*- coding: utf-8 -*-
+"""Banco SQLite com as partidas e os eventos da planilha, e as análises do app como consultas SQL.
+
+Uso:
+    python cruzeiro_sql.py "Cruzeiro Mineiro.xlsx"                  Importa a planilha no banco
+    python cruzeiro_sql.py "Cruzeiro Mineiro.xlsx" --banco dados.sqlite
+
+O banco (por padrão 'Cruzeiro Mineiro.sqlite', ao lado da planilha, ou CRUZEIRO_BANCO) tem as tabelas:
+    abas        id (ordem no arquivo), nome, faltando (colunas essenciais ausentes, em JSON)
+    partidas    id, aba_id, linha, ano, campeonato, partida, gols, assistencias (textos da planilha)
+    eventos     id (ordem da planilha), partida_id, aba_id, ano, tipo, jogador, jogador_id, classe
+    jogadores   id canônico -> nome de exibição
+    apelidos    apelido canonizado -> id do jogador
+    metadados   versão do banco e assinatura da planilha/apelidos importados
+Os eventos têm índices por jogador, por aba e por ano. Com CRUZEIRO_BACKEND=sqlite, o app e a
+API consultam o banco em vez de carregar a planilha (ver carregar_banco e executar_analise).
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from urllib.request import pathname2url
+
+import pandas as pd
+
+from cruzeiro_analises import (
+    TIPO_EVENTO, abas_da_competicao, abas_validas, tabela_eventos, tabela_lances, tabela_numeros_gerais
+)
+from cruzeiro_dados import (
+    assinatura_apelidos, assinatura_arquivo, carregar_base, congelar_base, id_jogador, listar_nomes_jogadores,
+    ordenar_ranking, tem_termo_ignorado
+)
+from cruzeiro_diagnostico import cronometrado
+
+VERSAO_BANCO = 1 # Incrementar quando o esquema mudar
+
+ESQUEMA = """
+CREATE TABLE abas (id INTEGER PRIMARY KEY, nome TEXT NOT NULL UNIQUE, faltando TEXT NOT NULL);
+CREATE TABLE partidas (
+    id INTEGER PRIMARY KEY, aba_id INTEGER NOT NULL REFERENCES abas(id), linha INTEGER NOT NULL,
+    ano INTEGER, campeonato TEXT, partida TEXT, gols TEXT, assistencias TEXT, UNIQUE (aba_id, linha)
+);
+CREATE TABLE eventos (
+    id INTEGER PRIMARY KEY, partida_id INTEGER NOT NULL REFERENCES partidas(id), aba_id INTEGER NOT NULL,
+    ano INTEGER, tipo TEXT NOT NULL, jogador TEXT NOT NULL, jogador_id TEXT NOT NULL, classe TEXT NOT NULL
+);
+CREATE TABLE jogadores (id TEXT PRIMARY KEY, nome TEXT NOT NULL);
+CREATE TABLE apelidos (apelido TEXT PRIMARY KEY, jogador_id TEXT NOT NULL);
+CREATE TABLE metadados (chave TEXT PRIMARY KEY, valor TEXT);
+CREATE INDEX eventos_jogador ON eventos (jogador_id, ano);
+CREATE INDEX eventos_aba_ano ON eventos (aba_id, ano, tipo);
+CREATE INDEX eventos_ano ON eventos (ano);
+CREATE INDEX partidas_ano ON partidas (ano);
+"""
+
+# Filtro de eventos que contam como participação (o mesmo de cruzeiro_dados.mascara_eventos_validos)
+_VALIDOS = "classe = '' AND jogador_id != 'nan'"
+
+# Bancos abertos neste processo: caminho absoluto -> (mtime, base)
+_BANCOS_ABERTOS = {}
+_TRAVA_BANCOS = threading.Lock()
+
+# --- Importação ---
+
+def usar_banco():
+    """Se o app e a API devem consultar o banco em vez da planilha (CRUZEIRO_BACKEND=sqlite; padrão 'excel')."""
+    return os.environ.get("CRUZEIRO_BACKEND", "excel").strip().lower() == "sqlite"
+
+def caminho_banco(arquivo):
+    """Banco da planilha: CRUZEIRO_BANCO ou '<planilha sem extensão>.sqlite' na pasta da planilha."""
+    return os.environ.get("CRUZEIRO_BANCO") or os.path.splitext(os.path.abspath(arquivo))[0] + ".sqlite"
+
+def _valor(x):
+    """Valor de célula para o SQLite (NaN/NA viram NULL, anos viram inteiros)."""
+    if pd.isna(x):
+        return None
+    return int(x) if isinstance(x, float) and x.is_integer() else x
+
+@cronometrado("sql: importação")
+def importar_planilha(arquivo, banco=None, workers=None):
+    """Grava a base da planilha (ver cruzeiro_dados.carregar_base) num banco SQLite novo.
+
+    O banco é montado num arquivo temporário e trocado de uma vez: quem está consultando o banco
+    antigo não vê uma importação pela metade. Os ids dos jogadores são os da carga, já com os
+    apelidos; se o arquivo de apelidos mudar, importe de novo. Devolve o caminho do banco.
+    """
+    banco = banco or caminho_banco(arquivo)
+    mtime, hash_arquivo = assinatura_arquivo(arquivo)
+    base = carregar_base(arquivo, workers=workers)
+    ids_abas = {aba: i for i, aba in enumerate(base["abas"])}
+
+    partidas = []
+    ids_partidas = {}
+    for aba in base["abas"]:
+        df = base["partidas"][aba]
+        colunas = {c: df[c] if c in df.columns else pd.Series(None, index=df.index, dtype=object) for c in ["ano", "campeonato", "partida", "gols", "assistências"]}
+        for linha, ano, campeonato, partida, gols, assistencias in zip(df.index, *colunas.values()):
+            ids_partidas[(aba, linha)] = len(partidas)
+            partidas.append((len(partidas), ids_abas[aba], int(linha), _valor(ano), _valor(campeonato), _valor(partida), _valor(gols), _valor(assistencias)))
+
+    eventos = base["eventos"]
+    linhas_eventos = [
+        (i, ids_partidas[(aba, linha)], ids_abas[aba], _valor(ano), tipo, jogador, jogador_id, classe)
+        for i, (aba, linha, ano, tipo, jogador, jogador_id, classe) in enumerate(zip(
+            eventos["aba"].astype(object), eventos["linha"], eventos["ano"], eventos["tipo"].astype(object),
+            eventos["jogador"].astype(object), eventos["jogador_limpo"].astype(object), eventos["classe"].astype(object)
+        ))
+    ]
+
+    metadados = {
+        "versao": VERSAO_BANCO,
+        "arquivo": os.path.basename(arquivo),
+        "mtime": mtime,
+        "hash": hash_arquivo,
+        "apelidos": assinatura_apelidos(arquivo),
+        "importado_em": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+    caminho_tmp = banco + ".tmp"
+    if os.path.exists(caminho_tmp):
+        os.remove(caminho_tmp)
+    with closing(sqlite3.connect(caminho_tmp)) as conexao:
+        conexao.executescript(ESQUEMA)
+        with conexao:
+            conexao.executemany("INSERT INTO abas VALUES (?, ?, ?)", [(i, aba, json.dumps(base["faltando"][aba], ensure_ascii=False)) for aba, i in ids_abas.items()])
+            conexao.executemany("INSERT INTO partidas VALUES (?, ?, ?, ?, ?, ?, ?, ?)", partidas)
+            conexao.executemany("INSERT INTO eventos VALUES (?, ?, ?, ?, ?, ?, ?, ?)", linhas_eventos)
+            conexao.executemany("INSERT INTO jogadores VALUES (?, ?)", base["nomes_por_jogador"].items())
+            conexao.executemany("INSERT INTO apelidos VALUES (?, ?)", base["apelidos"].items())
+            conexao.executemany("INSERT INTO metadados VALUES (?, ?)", [(chave, json.dumps(valor)) for chave, valor in metadados.items()])
+        conexao.execute("ANALYZE") # Estatísticas dos índices para o planejador de consultas
+    os.replace(caminho_tmp, banco)
+    return banco
+
+# --- Consultas ---
+
+def _conectar(banco):
+    """Conexão somente leitura (uma por consulta: o banco é lido por várias threads na API)."""
+    return closing(sqlite3.connect(f"file:{pathname2url(os.path.abspath(banco))}?mode=ro", uri=True))
+
+def consultar(base, sql, parametros=()):
+    """Executa uma consulta no banco da base e devolve o resultado como DataFrame."""
+    with _conectar(base["banco"]) as conexao:
+        return pd.read_sql_query(sql, conexao, params=list(parametros))
+
+def carregar_banco(banco):
+    """Abre o banco importado como uma base leve para as análises SQL (ver executar_analise).
+
+    Só as tabelas pequenas ficam em memória ('abas', 'faltando', 'apelidos', 'nomes_por_jogador' e
+    'nomes_jogadores', como na base de cruzeiro_dados); partidas e eventos são consultados no
+    banco, indicado em 'banco'. A base é somente leitura (ver cruzeiro_dados.congelar_base) e é
+    reaproveitada, por todas as threads, enquanto o mtime do banco não mudar.
+    """
+    chave = os.path.abspath(banco)
+    mtime = os.stat(chave).st_mtime_ns
+    with _TRAVA_BANCOS:
+        anterior = _BANCOS_ABERTOS.get(chave)
+        if anterior is None or anterior[0] != mtime:
+            _BANCOS_ABERTOS[chave] = (mtime, _abrir_banco(chave))
+        return _BANCOS_ABERTOS[chave][1]
+
+def _abrir_banco(banco):
+    """Lê as tabelas pequenas do banco para carregar_banco."""
+    with _conectar(banco) as conexao:
+        metadados = {chave: json.loads(valor) for chave, valor in conexao.execute("SELECT chave, valor FROM metadados")}
+        if metadados.get("versao") != VERSAO_BANCO:
+            raise ValueError(f"Banco '{banco}' é de outra versão ({metadados.get('versao')}); importe a planilha de novo.")
+        abas = conexao.execute("SELECT nome, faltando FROM abas ORDER BY id").fetchall()
+        nomes = dict(conexao.execute("SELECT id, nome FROM jogadores"))
+        apelidos = dict(conexao.execute("SELECT apelido, jogador_id FROM apelidos"))
+
+    base = {
+        "banco": banco,
+        "abas": [aba for aba, _ in abas],
+        "ids_abas": {aba: i for i, (aba, _) in enumerate(abas)},
+        "faltando": {aba: json.loads(faltando) for aba, faltando in abas},
+        "nomes_por_jogador": nomes,
+        "nomes_jogadores": listar_nomes_jogadores(nomes),
+        "apelidos": apelidos,
+        "metadados": metadados,
+    }
+    return congelar_base(base)
+
+def _filtro_abas(base, abas):
+    """Trecho 'aba_id IN (...)' e parâmetros para as abas informadas."""
+    ids = [base["ids_abas"][aba] for aba in abas]
+    return f"aba_id IN ({', '.join('?' * len(ids))})", ids
+
+# --- Análises ---
+
+@cronometrado("análise sql: numeros_gerais")
+def numeros_gerais(base, jogador, competicao="Todas"):
+    """Como cruzeiro_analises.numeros_gerais, somando os eventos do jogador no banco."""
+    filtro, parametros = _filtro_abas(base, abas_validas(base, abas_da_competicao(base, competicao), "numeros_gerais"))
+    resumo = consultar(base, f"""
+        SELECT e.aba_id, p.campeonato, e.ano,
+               SUM(e.tipo = 'gols') AS gols, SUM(e.tipo = 'assistências') AS "assistências"
+        FROM eventos e JOIN partidas p ON p.id = e.partida_id
+        WHERE e.jogador_id = ? AND {_VALIDOS} AND e.ano IS NOT NULL AND p.campeonato IS NOT NULL AND e.{filtro}
+        GROUP BY e.aba_id, p.campeonato, e.ano
+        ORDER BY e.aba_id, p.campeonato, e.ano
+    """, [id_jogador(jogador, base["apelidos"])] + parametros)
+    return tabela_numeros_gerais(resumo.rename(columns={"aba_id": "aba"})) # Ids na ordem das abas
+
+def _eventos_jogador(base, jogador, abas, tipo=None, ano=None):
+    """Eventos válidos do jogador nas abas (colunas ano, campeonato, partida, tipo), na ordem da planilha."""
+    jogador_id = id_jogador(jogador, base["apelidos"])
+    filtro, parametros = _filtro_abas(base, abas)
+    sql = f"""
+        SELECT e.ano, p.campeonato, p.partida, e.tipo
+        FROM eventos e JOIN partidas p ON p.id = e.partida_id
+        WHERE e.jogador_id = ? AND e.classe = '' AND e.{filtro}
+    """
+    parametros = [jogador_id] + parametros
+    if tipo:
+        sql += " AND e.tipo = ?"
+        parametros.append(tipo)
+    if ano:
+        sql += " AND e.ano = ?"
+        parametros.append(ano)
+    if tem_termo_ignorado(jogador_id):
+        sql += " AND 0" # Termos ignorados não são jogadores (ver cruzeiro_dados.eventos_do_jogador)
+    return consultar(base, sql + " ORDER BY e.id", parametros)
+
+@cronometrado("análise sql: jogos_participacoes")
+def jogos_participacoes(base, jogador, competicao="Todas"):
+    """Como cruzeiro_analises.jogos_participacoes."""
+    abas = abas_validas(base, abas_da_competicao(base, competicao), "jogos_participacoes")
+    return tabela_eventos(_eventos_jogador(base, jogador, abas))
+
+def _ranking(base, competicao, ano=None):
+    """Somas por jogador nas abas da competição (e no ano), desempatadas pelo primeiro evento na planilha."""
+    filtro, parametros = _filtro_abas(base, abas_da_competicao(base, competicao))
+    sql = f"""
+        SELECT jogador_id AS jogador_limpo,
+               SUM(tipo = 'gols') AS gols, SUM(tipo = 'assistências') AS "assistências", MIN(id) AS primeiro
+        FROM eventos WHERE {_VALIDOS} AND {filtro}
+    """
+    if ano:
+        sql += " AND ano = ?"
+        parametros.append(ano)
+    somas = consultar(base, sql + " GROUP BY jogador_id ORDER BY primeiro", parametros)
+    return ordenar_ranking(somas.drop(columns="primeiro"), base["nomes_por_jogador"])
+
+@cronometrado("análise sql: ranking")
+def ranking(base, competicao="Todas"):
+    """Como cruzeiro_analises.ranking."""
+    return _ranking(base, competicao)
+
+@cronometrado("análise sql: analise_por_ano")
+def analise_por_ano(base, competicao="Todas", ano=None):
+    """Como cruzeiro_analises.analise_por_ano."""
+    return _ranking(base, competicao, ano)
+
+@cronometrado("análise sql: lances_especiais")
+def lances_especiais(base, competicao="Todas", ano=None):
+    """Como cruzeiro_analises.lances_especiais (um lance repetido nas duas colunas da partida conta uma vez)."""
+    abas = abas_da_competicao(base, competicao)
+    filtro, parametros = _filtro_abas(base, abas)
+    filtro_ano = ""
+    if ano:
+        filtro_ano = " AND ano = ?"
+        parametros.append(ano)
+    contagem = consultar(base, f"""
+        SELECT aba_id, classe, SUM(n) AS n FROM (
+            SELECT aba_id, partida_id, classe, MAX(n) AS n FROM (
+                SELECT aba_id, partida_id, classe, tipo, COUNT(*) AS n
+                FROM eventos WHERE classe != '' AND {filtro}{filtro_ano}
+                GROUP BY aba_id, partida_id, classe, tipo
+            ) GROUP BY aba_id, partida_id, classe
+        ) GROUP BY aba_id, classe
+    """, parametros)
+    contagem["aba"] = [base["abas"][i] for i in contagem["aba_id"]]
+    return tabela_lances(contagem.set_index(["aba", "classe"])["n"], abas)
+
+@cronometrado("análise sql: gols")
+def listar_gols(base, jogador, ano=None):
+    """Como cruzeiro_analises.listar_gols."""
+    return tabela_eventos(_eventos_jogador(base, jogador, abas_validas(base, base["abas"], "gols"), TIPO_EVENTO["gols"], ano))
+
+@cronometrado("análise sql: assistencias")
+def listar_assistencias(base, jogador, ano=None):
+    """Como cruzeiro_analises.listar_assistencias."""
+    abas = abas_validas(base, base["abas"], "assistencias")
+    return tabela_eventos(_eventos_jogador(base, jogador, abas, TIPO_EVENTO["assistencias"], ano))
+
+# Mesmas chaves de cruzeiro_analises.ANALISES
+ANALISES_SQL = {
+    "numeros_gerais": numeros_gerais,
+    "jogos_participacoes": jogos_participacoes,
+    "ranking": ranking,
+    "analise_por_ano": analise_por_ano,
+    "lances_especiais": lances_especiais,
+    "gols": listar_gols,
+    "assistencias": listar_assistencias,
+}
+
+def main(argv=None):
+    """CLI: importa a planilha no banco SQLite."""
+    parser = argparse.ArgumentParser(description="Importa a planilha do Cruzeiro num banco SQLite.")
+    parser.add_argument("arquivo", nargs="?", default="Cruzeiro Mineiro.xlsx", help="Planilha de origem (padrão: %(default)s)")
+    parser.add_argument("--banco", default=None, help="Banco de destino (padrão: CRUZEIRO_BANCO ou '<planilha>.sqlite')")
+    parser.add_argument("--workers", type=int, default=None, help="Processos para ler as abas (padrão: CRUZEIRO_WORKERS ou 1)")
+    args = parser.parse_args(argv)
+
+    inicio = time.perf_counter()
+    banco = importar_planilha(args.arquivo, args.banco, args.workers)
+    with _conectar(banco) as conexao:
+        partidas, = conexao.execute("SELECT COUNT(*) FROM partidas").fetchone()
+        eventos, = conexao.execute("SELECT COUNT(*) FROM eventos").fetchone()
+    print(f"Banco gravado em '{banco}': {partidas} partidas, {eventos} eventos, "
+          f"{os.path.getsize(banco) / 1e6:.2f} MB ({time.perf_counter() - inicio:.2f}s)")
+
+if __name__ == "__main__":
+    main()
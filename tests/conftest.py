@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+"""Planilhas usadas pelos testes: a real e uma sintética (ver cruzeiro_benchmark.gerar_planilha)."""
+
+import os
+import shutil
+import sys
+
+import pytest
+
+PASTA_PROJETO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PASTA_PROJETO) # Os módulos ficam na raiz do repositório
+
+from cruzeiro_benchmark import gerar_planilha  # noqa: E402
+
+@pytest.fixture(scope="session")
+def planilha_real(tmp_path_factory):
+    """Cópia de 'Cruzeiro Mineiro.xlsx' numa pasta temporária (o snapshot da carga não suja o repositório)."""
+    caminho = tmp_path_factory.mktemp("real") / "Cruzeiro Mineiro.xlsx"
+    shutil.copy(os.path.join(PASTA_PROJETO, "Cruzeiro Mineiro.xlsx"), caminho)
+    return str(caminho)
+
+@pytest.fixture(scope="session")
+def planilha_sintetica(tmp_path_factory):
+    """Planilha sintética pequena, com espaços extras, termos ignorados e abas de tamanhos variados."""
+    caminho = tmp_path_factory.mktemp("sintetica") / "sintetica.xlsx"
+    gerar_planilha(str(caminho), escala=0.5, semente=1)
+    return str(caminho)
+
+@pytest.fixture(scope="session", params=["real", "sintetica"])
+def planilha(request):
+    """Cada teste que usa esta fixture roda com as duas planilhas."""
+    return request.getfixturevalue(f"planilha_{request.param}")
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+"""Um acervo com a planilha dividida por anos dá os mesmos resultados que a planilha inteira."""
+
+import json
+
+import pandas as pd
+import pytest
+from openpyxl import Workbook, load_workbook
+
+from cruzeiro_acervo import ARQUIVO_MANIFESTO, abas_do_acervo, carregar_particoes, listar_particoes, particoes_da_consulta
+from cruzeiro_analises import ANALISES, executar_analise
+from cruzeiro_dados import carregar_base
+
+ANO_DIVISAO = 2000
+
+def dividir_planilha(arquivo, pasta):
+    """Grava as partidas antes e a partir de ANO_DIVISAO em duas planilhas, com as mesmas abas e cabeçalhos."""
+    livro = load_workbook(arquivo, read_only=True)
+    partes = {"antigas.xlsx": Workbook(write_only=True), "recentes.xlsx": Workbook(write_only=True)}
+    for aba in livro.sheetnames:
+        linhas = livro[aba].iter_rows(values_only=True)
+        cabecalho = next(linhas, None) or ()
+        coluna_ano = [str(nome).strip().lower() for nome in cabecalho].index("ano")
+        planilhas = {nome: wb.create_sheet(aba) for nome, wb in partes.items()}
+        for planilha in planilhas.values():
+            planilha.append(cabecalho)
+        for linha in linhas:
+            ano = linha[coluna_ano]
+            recente = isinstance(ano, (int, float)) and ano >= ANO_DIVISAO
+            planilhas["recentes.xlsx" if recente else "antigas.xlsx"].append(linha)
+    livro.close()
+    for nome, wb in partes.items():
+        wb.save(pasta / nome)
+
+@pytest.fixture(scope="module")
+def acervo(planilha, tmp_path_factory):
+    """Pasta com a planilha dividida em duas partições e um manifesto com a faixa de anos das antigas."""
+    pasta = tmp_path_factory.mktemp("acervo")
+    dividir_planilha(planilha, pasta)
+    with open(pasta / ARQUIVO_MANIFESTO, "w", encoding="utf-8") as f:
+        json.dump({"planilhas": [
+            {"arquivo": "antigas.xlsx", "fonte": "Antigas", "anos": [1900, ANO_DIVISAO - 1]},
+            {"arquivo": "recentes.xlsx", "fonte": "Recentes"},
+        ]}, f)
+    carregar_base(str(pasta / "recentes.xlsx")) # Grava o snapshot, de onde vem a faixa de anos das recentes
+    return str(pasta)
+
+def normalizar(df, analise):
+    """Empates nos rankings podem mudar de ordem entre partições: compara pela ordem do desempate e pelo nome."""
+    if analise in ["ranking", "analise_por_ano"]:
+        df = df.drop(columns="Rank").sort_values(
+            ["Total Participações", "Gols", "Assistências", "Jogador"], ascending=[False, False, False, True], ignore_index=True
+        )
+    return df
+
+def test_particoes_podadas_por_ano(acervo):
+    particoes = listar_particoes(acervo)
+    assert [p["fonte"] for p in particoes] == ["Antigas", "Recentes"]
+    assert particoes[1]["anos"] is not None and particoes[1]["anos"][0] >= ANO_DIVISAO
+    assert [p["fonte"] for p in particoes_da_consulta(particoes, "analise_por_ano", ano=1971)] == ["Antigas"]
+    assert [p["fonte"] for p in particoes_da_consulta(particoes, "ranking", ano=1971)] == ["Antigas", "Recentes"] # O ranking ignora o ano
+    assert particoes_da_consulta(particoes, "analise_por_ano", ano=1800) == []
+
+def test_consulta_sem_particoes_tem_as_abas_do_acervo(planilha, acervo):
+    """Sem partições na consulta, a base combinada tem as competições do acervo, vazias (o app mostra um resultado vazio)."""
+    particoes = listar_particoes(acervo)
+    base = carregar_particoes([], abas_acervo=abas_do_acervo(particoes))
+    assert base["abas"] == carregar_base(planilha)["abas"]
+    assert all(base["partidas"][aba].empty and not base["faltando"][aba] for aba in base["abas"])
+    assert executar_analise(base, "analise_por_ano", competicao=base["abas"][0], ano=1800).empty
+
+@pytest.mark.parametrize("analise", list(ANALISES))
+def test_analises_iguais_as_da_planilha_inteira(planilha, acervo, analise):
+    base = carregar_base(planilha)
+    particoes = listar_particoes(acervo)
+    ranking = executar_analise(base, "ranking")
+    jogadores = list(ranking["Jogador"].iloc[[0, len(ranking) // 2]])
+    for jogador in jogadores:
+        for competicao in ["Todas", base["abas"][0], base["abas"][-1]]:
+            for ano in [None, 1971, 2003, 1800]: # Em 1800, a poda descarta todas as partições
+                consulta = particoes_da_consulta(particoes, analise, competicao, ano)
+                combinada = carregar_particoes(consulta, abas_acervo=abas_do_acervo(particoes))
+                esperado = executar_analise(base, analise, jogador=jogador, competicao=competicao, ano=ano)
+                obtido = executar_analise(combinada, analise, jogador=jogador, competicao=competicao, ano=ano)
+                pd.testing.assert_frame_equal(
+                    normalizar(obtido, analise), normalizar(esperado, analise),
+                    obj=f"{analise} ({jogador}, {competicao}, {ano})"
+                )
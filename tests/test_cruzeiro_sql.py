@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+"""As análises SQL (cruzeiro_sql) devolvem as mesmas tabelas, com os mesmos tipos, que as do pandas."""
+
+import pandas as pd
+import pytest
+
+from cruzeiro_analises import ANALISES, executar_analise
+from cruzeiro_dados import carregar_base
+from cruzeiro_sql import carregar_banco, importar_planilha
+
+@pytest.fixture(scope="module")
+def bases(planilha, tmp_path_factory):
+    """Base do pandas e base do banco importado da mesma planilha."""
+    banco = importar_planilha(planilha, str(tmp_path_factory.mktemp("banco") / "dados.sqlite"))
+    return carregar_base(planilha), carregar_banco(banco)
+
+def consultas(base):
+    """Jogadores, competições e anos de teste, incluindo filtros sem dados (resultados vazios)."""
+    ranking = executar_analise(base, "ranking")
+    jogadores = list(ranking["Jogador"].iloc[[0, 1, len(ranking) // 2, -1]])
+    jogadores += [jogadores[0].upper(), "Penalti", "Ninguém"] # Outra grafia, termo ignorado e jogador inexistente
+    competicoes = ["Todas", base["abas"][0], base["abas"][-1], "Inexistente"]
+    ano = int(base["eventos"]["ano"].median())
+    return jogadores, competicoes, [None, ano, 1800]
+
+@pytest.mark.parametrize("analise", list(ANALISES))
+def test_analises_sql_iguais_as_do_pandas(bases, analise):
+    base, banco = bases
+    jogadores, competicoes, anos = consultas(base)
+    for jogador in jogadores:
+        for competicao in competicoes:
+            for ano in anos:
+                esperado = executar_analise(base, analise, jogador=jogador, competicao=competicao, ano=ano)
+                obtido = executar_analise(banco, analise, jogador=jogador, competicao=competicao, ano=ano)
+                pd.testing.assert_frame_equal(obtido, esperado, obj=f"{analise} ({jogador}, {competicao}, {ano})")
@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+"""A leitura em fluxo das abas (openpyxl read_only) dá o mesmo resultado que a aba inteira lida pelo pd.read_excel.
+
+E não guarda a aba bruta: a memória além das tabelas devolvidas quase não cresce com a aba.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import weakref
+
+import pandas as pd
+import pytest
+from openpyxl import Workbook, load_workbook
+
+import cruzeiro_dados
+from cruzeiro_dados import COLUNAS_ESSENCIAIS, explodir_eventos, ler_abas, normalizar_aba, processar_aba
+
+def ler_abas_read_excel(arquivo):
+    """Leitura anterior à leitura em fluxo: cada aba inteira pelo pd.read_excel, normalizada e explodida."""
+    resultados = []
+    for aba, df in pd.read_excel(arquivo, sheet_name=None).items():
+        df = normalizar_aba(df)
+        resultados.append((aba, df, [c for c in COLUNAS_ESSENCIAIS if c not in df.columns], explodir_eventos(df, aba)))
+    return resultados
+
+def comparar(obtidos, esperados):
+    assert [aba for aba, _, _, _ in obtidos] == [aba for aba, _, _, _ in esperados]
+    for (aba, partidas, faltando, eventos), (_, partidas_esperadas, faltando_esperado, eventos_esperados) in zip(obtidos, esperados):
+        pd.testing.assert_frame_equal(partidas, partidas_esperadas, obj=f"partidas de '{aba}'")
+        assert faltando == faltando_esperado, aba
+        pd.testing.assert_frame_equal(eventos, eventos_esperados, obj=f"eventos de '{aba}'")
+
+@pytest.fixture(scope="module")
+def planilha_casos(tmp_path_factory):
+    """Planilha com os casos de borda da leitura: vazios, textos de NA, erros, colunas repetidas ou ausentes."""
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Casos"
+    ws.append([" Ano ", "Jogo", "Partida", "Campeonato", "Gols", "Assistências", "gols", "Obs."])
+    ws.append([2001, 1, "Cruzeiro 2x0 Vasco", "Brasileiro", "Alex; Fred", "Sem ass;Alex", "ignorada", "x"])
+    ws.append([None, None, None, None, None, None, None, None]) # Linha vazia no meio: fica, como no read_excel
+    ws.append(["2002", 2, "Cruzeiro 1x1 Bahia", "Brasileiro", "NA", "#N/A", None, None])
+    ws.append([2002.0, 3, 2024, "n/a", "Gol contra", 7, None, None]) # Partida numérica e assistência não textual
+    ws.append(["sem ano", 4, "Cruzeiro 3x1 Sport", None, "Fred;;Tostão ", "", None, None])
+    ws.append([2003, 5, "#DIV/0!", "Brasileiro", "Penalti", "Fred", None, None])
+    ws.append([None] * 8) # Linhas vazias no fim: descartadas
+    ws.append([""] * 8)
+    sem_colunas = wb.create_sheet("Sem gols")
+    sem_colunas.append(["Ano", "Partida", "Campeonato", "Assistências"])
+    sem_colunas.append([1999, "Cruzeiro 1x0 Atlético", "Mineiro", None]) # Coluna toda vazia
+    wb.create_sheet("Vazia")
+    caminho = tmp_path_factory.mktemp("casos") / "casos.xlsx"
+    wb.save(caminho)
+    return str(caminho)
+
+@pytest.mark.parametrize("tamanho_bloco", [None, 2])
+def test_casos_de_borda(planilha_casos, monkeypatch, tamanho_bloco):
+    if tamanho_bloco:
+        monkeypatch.setattr(cruzeiro_dados, "TAMANHO_BLOCO", tamanho_bloco)
+    comparar(ler_abas(planilha_casos), ler_abas_read_excel(planilha_casos))
+
+@pytest.mark.parametrize("tamanho_bloco", [None, 7])
+def test_planilhas_iguais_ao_read_excel(planilha, monkeypatch, tamanho_bloco):
+    if tamanho_bloco:
+        monkeypatch.setattr(cruzeiro_dados, "TAMANHO_BLOCO", tamanho_bloco) # Muitos blocos por aba
+    comparar(ler_abas(planilha), ler_abas_read_excel(planilha))
+
+def test_filtro_de_anos_na_leitura(planilha):
+    anos = [1971, 2003]
+    for aba, partidas, faltando, eventos in ler_abas(planilha, anos=anos):
+        assert partidas["ano"].isin(anos).all(), aba
+        assert eventos["ano"].isin(anos).all(), aba
+    esperados = {aba: eventos for aba, _, _, eventos in ler_abas_read_excel(planilha)}
+    obtidos = pd.concat([eventos for _, _, _, eventos in ler_abas(planilha, anos=anos)], ignore_index=True)
+    esperado = pd.concat([eventos[eventos["ano"].isin(anos)] for eventos in esperados.values()], ignore_index=True)
+    pd.testing.assert_frame_equal(obtidos, esperado, check_dtype=False)
+
+# --- Memória ---
+
+TAMANHO_BLOCO_MEMORIA = 500
+
+# Pico e memória retida por processar_aba, somando os objetos Python (tracemalloc) e o pool do Arrow,
+# onde ficam os textos. Roda num processo novo: o pico do pool não pode ser zerado
+MEDIR_PICO = """
+import json, sys, tracemalloc
+import pyarrow as pa
+from openpyxl import load_workbook
+import cruzeiro_dados
+cruzeiro_dados.TAMANHO_BLOCO = int(sys.argv[2])
+livro = load_workbook(sys.argv[1], read_only=True, data_only=True, keep_links=False)
+pool = pa.default_memory_pool()
+inicio = pool.bytes_allocated()
+tracemalloc.start()
+resultado = cruzeiro_dados.processar_aba(sys.argv[1], "Aba", livro["Aba"])
+retido, pico = tracemalloc.get_traced_memory()
+print(json.dumps({"pico": pico + pool.max_memory() - inicio, "retido": retido + pool.bytes_allocated() - inicio}))
+"""
+
+def gerar_aba(caminho, linhas):
+    """Planilha com uma aba de `linhas` partidas, com gols, assistências e uma coluna que não é lida."""
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Aba")
+    ws.append(["Ano", "Jogo", "Partida", "Campeonato", "Gols", "Assistências", "Obs."])
+    for i in range(linhas):
+        ws.append([1950 + i % 70, i, f"Cruzeiro {i % 5}x{i % 3} Time {i % 40}", "Brasileiro",
+                   f"Jogador {i % 300}; Jogador {(i * 7) % 300}", f"Jogador {(i * 13) % 300}", "x" * 30])
+    wb.save(caminho)
+    return str(caminho)
+
+@pytest.fixture(scope="module")
+def abas_crescentes(tmp_path_factory):
+    """A mesma aba com 4 e com 16 blocos."""
+    pasta = tmp_path_factory.mktemp("memoria")
+    return [gerar_aba(pasta / f"aba_{linhas}.xlsx", linhas) for linhas in [4 * TAMANHO_BLOCO_MEMORIA, 16 * TAMANHO_BLOCO_MEMORIA]]
+
+def test_blocos_brutos_liberados_um_a_um(abas_crescentes, monkeypatch):
+    monkeypatch.setattr(cruzeiro_dados, "TAMANHO_BLOCO", TAMANHO_BLOCO_MEMORIA)
+    vivos, maximo = [], [0]
+    bloco_original = cruzeiro_dados._bloco
+    def bloco_observado(*args):
+        bloco = bloco_original(*args)
+        vivos.append(weakref.ref(bloco))
+        maximo[0] = max(maximo[0], sum(ref() is not None for ref in vivos))
+        return bloco
+    monkeypatch.setattr(cruzeiro_dados, "_bloco", bloco_observado)
+
+    livro = load_workbook(abas_crescentes[-1], read_only=True, data_only=True, keep_links=False)
+    try:
+        processar_aba(abas_crescentes[-1], "Aba", livro["Aba"])
+    finally:
+        livro.close()
+    assert len(vivos) == 16
+    assert maximo[0] == 1 # Nunca mais de um bloco bruto em memória
+
+def test_pico_de_memoria_nao_acompanha_a_aba(abas_crescentes):
+    medidas = [
+        json.loads(subprocess.run(
+            [sys.executable, "-c", MEDIR_PICO, arquivo, str(TAMANHO_BLOCO_MEMORIA)],
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))), capture_output=True, text=True, check=True
+        ).stdout)
+        for arquivo in abas_crescentes
+    ]
+    excessos = [medida["pico"] - medida["retido"] for medida in medidas] # Memória além das tabelas devolvidas
+    crescimento = medidas[1]["retido"] - medidas[0]["retido"]
+    # Com a aba bruta inteira em memória, o excesso cresceria quase tanto quanto as tabelas; sem ela,
+    # resta a cópia das colunas numéricas feita ao juntar os pedaços (os textos do Arrow não são copiados)
+    assert excessos[1] - excessos[0] < crescimento / 2, (excessos, crescimento)
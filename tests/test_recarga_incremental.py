@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""A recarga incremental (atualizar_base) relê só as abas alteradas e dá a mesma base que a leitura completa."""
+
+import re
+import shutil
+import zipfile
+
+import pandas as pd
+from openpyxl import load_workbook
+
+import cruzeiro_dados
+from cruzeiro_dados import _partes_xlsx, atualizar_base, ler_planilha
+
+def comparar_bases(obtida, esperada):
+    assert obtida["abas"] == esperada["abas"]
+    assert obtida["faltando"] == esperada["faltando"]
+    assert obtida["assinaturas"] == esperada["assinaturas"]
+    for aba in esperada["abas"]:
+        pd.testing.assert_frame_equal(obtida["partidas"][aba], esperada["partidas"][aba], obj=f"partidas de '{aba}'")
+    pd.testing.assert_frame_equal(obtida["eventos"], esperada["eventos"], obj="eventos")
+    pd.testing.assert_frame_equal(obtida["cubo"], esperada["cubo"], obj="cubo")
+
+def alterar_ano(arquivo, aba):
+    """Soma 1 ao primeiro ano numérico do XML da aba, regravando o .xlsx sem tocar nas outras partes."""
+    with zipfile.ZipFile(arquivo) as z:
+        parte = _partes_xlsx(z)[0][aba]
+        conteudos = [(item, z.read(item.filename)) for item in z.infolist()]
+    with zipfile.ZipFile(arquivo, "w") as z:
+        for item, conteudo in conteudos:
+            if item.filename == parte:
+                conteudo, n = re.subn(rb"(<c [^>]*>)<v>((?:19|20)\d\d)</v>", lambda m: m[1] + b"<v>%d</v>" % (int(m[2]) + 1), conteudo, count=1)
+                assert n == 1, aba
+            z.writestr(item, conteudo)
+
+def espiar(monkeypatch, nome):
+    """Troca a função de cruzeiro_dados por uma que anota os argumentos de cada chamada."""
+    chamadas = []
+    original = getattr(cruzeiro_dados, nome)
+    def espia(*args, **kwargs):
+        chamadas.append(args)
+        return original(*args, **kwargs)
+    monkeypatch.setattr(cruzeiro_dados, nome, espia)
+    return chamadas
+
+def test_so_a_aba_alterada_e_relida(planilha, tmp_path, monkeypatch):
+    arquivo = str(tmp_path / "copia.xlsx")
+    shutil.copy(planilha, arquivo)
+    base = ler_planilha(arquivo)
+    aba = base["abas"][1]
+    alterar_ano(arquivo, aba)
+
+    leituras = espiar(monkeypatch, "ler_abas")
+    atualizada = atualizar_base(base, arquivo)
+    assert [args[1] for args in leituras] == [[aba]]
+    assert not atualizada["partidas"][aba].equals(base["partidas"][aba])
+    monkeypatch.undo()
+    comparar_bases(atualizada, ler_planilha(arquivo))
+
+def test_planilha_regravada_pelo_openpyxl_e_relida_inteira(planilha_real, tmp_path, monkeypatch):
+    """O openpyxl regrava os textos de outra forma (textos em linha): os índices antigos não valem mais."""
+    arquivo = str(tmp_path / "copia.xlsx")
+    shutil.copy(planilha_real, arquivo)
+    base = ler_planilha(arquivo)
+    livro = load_workbook(arquivo)
+    livro.save(arquivo)
+
+    leituras = espiar(monkeypatch, "ler_planilha")
+    atualizada = atualizar_base(base, arquivo)
+    assert len(leituras) == 1
+    monkeypatch.undo()
+    comparar_bases(atualizada, ler_planilha(arquivo))
@@ -0,0 +1,23 @@
+# -*- coding: utf-8 -*-
+"""A base lida do snapshot colunar é igual à lida do Excel, com os mesmos tipos em cada aba."""
+
+import shutil
+
+import pandas as pd
+
+from cruzeiro_dados import assinatura_arquivo, carregar_snapshot, ler_planilha, salvar_snapshot
+
+def test_snapshot_igual_ao_excel(planilha, tmp_path):
+    arquivo = str(tmp_path / "copia.xlsx") # Snapshot próprio, sem o gravado pelas cargas de outros testes
+    shutil.copy(planilha, arquivo)
+    mtime, hash_arquivo = assinatura_arquivo(arquivo)
+    base = ler_planilha(arquivo)
+    salvar_snapshot(base, arquivo, mtime, hash_arquivo)
+    lida = carregar_snapshot(arquivo, mtime, hash_arquivo)
+
+    assert lida["abas"] == base["abas"]
+    assert lida["faltando"] == base["faltando"]
+    for aba in base["abas"]:
+        pd.testing.assert_frame_equal(lida["partidas"][aba], base["partidas"][aba], obj=f"partidas de '{aba}'")
+    pd.testing.assert_frame_equal(lida["eventos"], base["eventos"], obj="eventos")
+    pd.testing.assert_frame_equal(lida["cubo"], base["cubo"], obj="cubo")